@@ -81,6 +81,19 @@ def _apply_env_hardening(settings: Dict[str, Any], env_name: str) -> Dict[str, A
     return settings
 
 
+def resolve_config_path(env_name: str, path: str | None = None) -> str:
+    """
+    Caminho ABSOLUTO do YAML de configuração de um ambiente.
+
+    - `path`, se fornecido, é relativo ao diretório do app.py.
+    - Senão, o arquivo vem do CONFIG_MAP (lab_dummy para ambiente desconhecido).
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    if path is None:
+        path = CONFIG_MAP.get(env_name, CONFIG_MAP["lab_dummy"])
+    return os.path.join(base_dir, path)
+
+
 def load_settings(
     path: str | None = None,
     env_name_override: str | None = None,
@@ -95,24 +108,14 @@ def load_settings(
 
     Usa caminho ABSOLUTO baseado no diretório do app.py.
     """
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-
     # 1) Determina o ambiente
     if env_name_override is not None:
         env_name = env_name_override
-        if path is None:
-            cfg_rel_path = CONFIG_MAP.get(env_name, CONFIG_MAP["lab_dummy"])
-        else:
-            cfg_rel_path = path
     else:
         env_name = os.getenv("APP_ENV", "lab_dummy")
-        if path is None:
-            cfg_rel_path = CONFIG_MAP.get(env_name, CONFIG_MAP["lab_dummy"])
-        else:
-            cfg_rel_path = path
 
     # 2) Monta caminho absoluto do YAML
-    cfg_path = os.path.join(base_dir, cfg_rel_path)
+    cfg_path = resolve_config_path(env_name, path)
 
     if not os.path.exists(cfg_path):
         raise FileNotFoundError(f"Arquivo de configuração não encontrado: {cfg_path}")
@@ -16,7 +16,7 @@ class BacktestConfig:
     slippage_bps: float = 0.0     # slippage em basis points (1 bp = 0.01%)
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestTrade:
     ts: float
     side: str
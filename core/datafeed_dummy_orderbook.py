@@ -81,29 +81,37 @@ class UltraDummyOrderBookFeed:
             - bids: [(price, size), ...]
             - asks: [(price, size), ...]
         """
+        # métodos e constantes usados a cada tick, resolvidos uma vez só
+        simulate_micro_events = self._simulate_micro_events
+        build_order_book = self._build_order_book
+        sample_last_trade = self._sample_last_trade
+        now = time.time
+        symbol = self.symbol
+        tick_sleep = self.tick_sleep
+
         while True:
             self._tick_counter += 1
 
             # 1) Simula alguns eventos de microestrutura antes de "observar" o book
-            self._simulate_micro_events()
+            simulate_micro_events()
 
             # 2) A partir do mid+spread, constrói o book
-            bids, asks = self._build_order_book()
+            bids, asks = build_order_book()
 
             best_bid, best_bid_size = bids[0]
             best_ask, best_ask_size = asks[0]
 
             # 3) Decide o último preço negociado (last) neste tick
-            last = self._sample_last_trade(best_bid, best_ask)
+            last = sample_last_trade(best_bid, best_ask)
 
-            ts = time.time()
+            ts = now()
 
             # 4) Agrega tamanho total de cada lado (para estratégias de imbalance)
             total_bid_size = sum(size for _, size in bids)
             total_ask_size = sum(size for _, size in asks)
 
             tick = {
-                "symbol": self.symbol,
+                "symbol": symbol,
                 "ts": ts,
                 "last": last,
                 "bid": best_bid,
@@ -116,8 +124,8 @@ class UltraDummyOrderBookFeed:
 
             yield tick
 
-            if self.tick_sleep > 0:
-                time.sleep(self.tick_sleep)
+            if tick_sleep > 0:
+                time.sleep(tick_sleep)
 
     # ------------------------------------------------------------------ #
     # Microestrutura
@@ -92,9 +92,22 @@ class BinanceWebSocketDataFeed:
         """
         self._ensure_ws_running()
 
-        while True:
-            tick = self._queue.get()  # bloqueia até chegar dado
-            yield tick
+        try:
+            while True:
+                tick = self._queue.get()  # bloqueia até chegar dado
+                yield tick
+        finally:
+            # generator fechado (close()/coletado): derruba o WebSocket
+            self.disconnect()
+
+    def disconnect(self) -> None:
+        """
+        Para o loop de reconexão e fecha o WebSocket atual; a thread de
+        background termina logo em seguida.
+        """
+        self._running = False
+        if self._ws_app is not None:
+            self._ws_app.close()
 
     # ------------------------------------------------------------------ #
     # WebSocket
@@ -12,7 +12,7 @@ from core.position import PositionManager
 from core.execution import ExecutionClient
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineEvent:
     """
     Evento gerado pelo TradingEngine a cada tick/processamento.
@@ -246,8 +246,10 @@ class TradingEngine:
 
         self.trade_count += 1
 
-        # Snapshot de posição
-        pos_snap = self.position.snapshot()
+        # Estado da posição lido direto das propriedades (sem montar o
+        # PositionState de snapshot() a cada trade)
+        position_qty = self.position.qty
+        position_avg_price = self.position.avg_price
 
         # Evento de trade executado
         events.append(
@@ -261,9 +263,9 @@ class TradingEngine:
                     "signal_tag": signal.tag,
                     "order_response": order_res,
                     "trade_pnl": trade_pnl,
-                    "realized_pnl_total": pos_snap.realized_pnl,
-                    "position_qty": pos_snap.qty,
-                    "position_avg_price": pos_snap.avg_price,
+                    "realized_pnl_total": realized_after,
+                    "position_qty": position_qty,
+                    "position_avg_price": position_avg_price,
                     "equity": equity,
                 },
             )
@@ -279,9 +281,9 @@ class TradingEngine:
                 "price": fill_price,
                 "signal_tag": signal.tag,
                 "trade_pnl": trade_pnl,
-                "realized_pnl_total": pos_snap.realized_pnl,
-                "position_qty": pos_snap.qty,
-                "position_avg_price": pos_snap.avg_price,
+                "realized_pnl_total": realized_after,
+                "position_qty": position_qty,
+                "position_avg_price": position_avg_price,
                 "equity": equity,
             },
         )
@@ -2,8 +2,10 @@
 
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class InventoryLimits:
     """
     Limites de inventário para um único símbolo.
@@ -78,3 +80,46 @@ class InventoryRiskManager:
                 f"Limite de inventário em notional violado: "
                 f"{pct_equity:.2f}% > {self.limits.max_notional_pct:.2f}% do equity."
             )
+
+    def validate_batch(
+        self,
+        current_qtys,
+        trade_sides,
+        trade_qtys,
+        prices,
+        account_equities,
+    ) -> np.ndarray:
+        """
+        Versão vetorizada de validate_inventory() para muitos trades candidatos
+        (ex: backtests). Aceita arrays do mesmo tamanho ou escalares.
+        - trade_sides: +1 (BUY) / -1 (SELL), como em PositionManager.replay().
+
+        Retorna máscara booleana: True onde o trade respeita os dois limites
+        (mesmos critérios de validate_inventory, sem levantar exceção).
+        Entradas inválidas levantam ValueError, como no caso unitário.
+        """
+        # valida antes do cast: int8 truncaria 1.7 / -1.2 para ±1
+        trade_sides = np.asarray(trade_sides)
+        if not np.isin(trade_sides, (1, -1)).all():
+            raise ValueError("trade_sides deve conter apenas +1 (BUY) ou -1 (SELL).")
+
+        current_qtys, dirs, trade_qtys, prices, account_equities = np.broadcast_arrays(
+            np.asarray(current_qtys, dtype=np.float64),
+            trade_sides.astype(np.int8),
+            np.asarray(trade_qtys, dtype=np.float64),
+            np.asarray(prices, dtype=np.float64),
+            np.asarray(account_equities, dtype=np.float64),
+        )
+
+        if np.any(trade_qtys <= 0):
+            raise ValueError("trade_qty deve ser positiva em validate_batch().")
+        if np.any(account_equities <= 0):
+            raise ValueError("Equity da conta inválido para validação de inventário.")
+
+        # Posições hipotéticas após cada trade
+        abs_new_qty = np.abs(current_qtys + dirs * trade_qtys)
+        pct_equity = (abs_new_qty * prices / account_equities) * 100.0
+
+        return (abs_new_qty <= self.limits.max_abs_qty) & (
+            pct_equity <= self.limits.max_notional_pct
+        )
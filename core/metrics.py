@@ -0,0 +1,48 @@
+# core/metrics.py
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba é opcional: sem ele usamos o caminho NumPy
+    njit = None
+
+
+def _max_drawdown_loop(equity: np.ndarray) -> float:
+    """
+    Passada única sobre a curva: atualiza o pico e o maior drawdown no mesmo
+    loop, sem arrays intermediários. Compilada com numba quando disponível.
+    """
+    peak = equity[0]
+    max_dd = 0.0
+    for i in range(equity.size):
+        eq = equity[i]
+        if eq > peak:
+            peak = eq
+        dd = peak - eq
+        if dd > max_dd:
+            max_dd = dd
+    return max_dd
+
+
+if njit is not None:
+    _max_drawdown_loop = njit(cache=True)(_max_drawdown_loop)
+    # Pré-aquece no import, para o primeiro rerun do Streamlit não pagar o JIT
+    _max_drawdown_loop(np.zeros(1, dtype=np.float64))
+
+
+def max_drawdown(equity) -> float:
+    """
+    Maior queda absoluta da equity em relação ao pico anterior.
+
+    - Com numba: loop compilado (pico + drawdown fundidos numa passada).
+    - Sem numba: cummax vetorizado do NumPy.
+    """
+    eq = np.ascontiguousarray(equity, dtype=np.float64)
+    if eq.size == 0:
+        return 0.0
+
+    if njit is not None:
+        return float(_max_drawdown_loop(eq))
+
+    return float((np.maximum.accumulate(eq) - eq).max())
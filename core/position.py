@@ -2,8 +2,15 @@
 
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+try:
+    from numba import njit
+except ImportError:  # numba é opcional: sem ele o replay roda em Python puro
+    njit = None
+
+
+@dataclass(slots=True)
 class PositionState:
     """
     Snapshot do estado da posição.
@@ -13,6 +20,56 @@ class PositionState:
     realized_pnl: float
 
 
+def _replay_loop(qty, avg_price, realized, dirs, qtys, prices, realized_out):
+    """
+    Mesmas regras e mesma formulação de on_trade() (nova posição = soma com
+    sinal), fill a fill, sobre arrays. A posição depende do caminho (preço
+    médio zera/reinicia em fechamentos e reversões), então é uma passada
+    sequencial; com numba, compilada.
+    """
+    for i in range(len(dirs)):
+        trade_qty = qtys[i]
+        price = prices[i]
+        signed_qty = dirs[i] * trade_qty
+        new_qty = qty + signed_qty
+
+        if qty == 0.0:
+            avg_price = price
+        elif (qty > 0.0) == (signed_qty > 0.0):
+            old_abs_qty = abs(qty)
+            avg_price = (
+                (avg_price * old_abs_qty) + (price * trade_qty)
+            ) / (old_abs_qty + trade_qty)
+        else:
+            current_dir = 1.0 if qty > 0.0 else -1.0
+            close_qty = min(abs(qty), trade_qty)
+            realized += (price - avg_price) * close_qty * current_dir
+
+            if new_qty == 0.0:
+                avg_price = 0.0
+            elif (new_qty > 0.0) != (qty > 0.0):
+                avg_price = price
+
+        qty = new_qty
+        realized_out[i] = realized
+
+    return qty, avg_price, realized
+
+
+if njit is not None:
+    _replay_loop = njit(cache=True)(_replay_loop)
+    # Pré-aquece no import, como em core.metrics
+    _replay_loop(
+        0.0,
+        0.0,
+        0.0,
+        np.ones(1, dtype=np.int8),
+        np.ones(1, dtype=np.float64),
+        np.ones(1, dtype=np.float64),
+        np.empty(1, dtype=np.float64),
+    )
+
+
 class PositionManager:
     """
     Gerencia posição e PnL de um único símbolo linear (ex: BTCUSDT).
@@ -62,20 +119,79 @@ class PositionManager:
         if side not in ("BUY", "SELL"):
             raise ValueError("side deve ser 'BUY' ou 'SELL'.")
 
-        if self._qty == 0:
+        # A nova posição é sempre a soma com sinal; só o preço médio e o PnL
+        # realizado dependem do caso (abre, aumenta, fecha ou reverte).
+        pos = self._qty
+        signed_qty = qty if side == "BUY" else -qty
+        new_qty = pos + signed_qty
+
+        if pos == 0:
             # Sem posição: abre nova
-            self._open_new_position(side, qty, price)
+            self._avg_price = price
+        elif (pos > 0) == (signed_qty > 0):
+            # Mesma direção: preço médio ponderado
+            old_abs_qty = abs(pos)
+            self._avg_price = (
+                (self._avg_price * old_abs_qty) + (price * qty)
+            ) / (old_abs_qty + qty)
         else:
-            # Já existe posição
-            current_dir = 1 if self._qty > 0 else -1
-            trade_dir = 1 if side == "BUY" else -1
+            # Direção oposta: realiza PnL da parte fechada
+            current_dir = 1 if pos > 0 else -1
+            close_qty = min(abs(pos), qty)
+            self._realized_pnl += (price - self._avg_price) * close_qty * current_dir
+
+            if new_qty == 0:
+                # Fechou completamente e fica zerado
+                self._avg_price = 0.0
+            elif (new_qty > 0) != (pos > 0):
+                # Fechou tudo e abriu posição na direção oposta
+                self._avg_price = price
+            # Fechamento parcial: preço médio da parte restante continua o mesmo
+
+        self._qty = new_qty
+
+    def replay(self, sides, qtys, prices) -> np.ndarray:
+        """
+        Aplica uma sequência de fills de uma vez (backtests/replays longos).
 
-            if current_dir == trade_dir:
-                # Mesma direção: aumenta posição e ajusta preço médio
-                self._add_to_position(qty, price, trade_dir)
-            else:
-                # Direção oposta: fecha parcial ou total, podendo reverter
-                self._close_or_reverse(qty, price, trade_dir)
+        sides: +1 (BUY) / -1 (SELL), um por fill
+        qtys:  quantidades positivas
+        prices: preços de execução
+
+        Equivale a chamar on_trade() para cada fill, em ordem. Retorna o
+        realized_pnl acumulado após cada fill.
+        """
+        sides = np.asarray(sides)
+        qtys = np.ascontiguousarray(qtys, dtype=np.float64)
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+
+        if not (sides.shape == qtys.shape == prices.shape) or sides.ndim != 1:
+            raise ValueError("sides, qtys e prices devem ser 1-D e do mesmo tamanho.")
+        if np.any(qtys <= 0):
+            raise ValueError("qty deve ser positiva em replay().")
+        # valida antes do cast: int8 truncaria 1.7 / -1.2 para ±1
+        if not np.isin(sides, (1, -1)).all():
+            raise ValueError("sides deve conter apenas +1 (BUY) ou -1 (SELL).")
+        dirs = sides.astype(np.int8)
+
+        if njit is None:
+            # Sem numba, listas evitam aritmética com escalares NumPy no loop
+            fills = (dirs.tolist(), qtys.tolist(), prices.tolist())
+        else:
+            fills = (dirs, qtys, prices)
+
+        realized_out = np.empty(dirs.size, dtype=np.float64)
+        self._qty, self._avg_price, self._realized_pnl = _replay_loop(
+            float(self._qty),
+            float(self._avg_price),
+            float(self._realized_pnl),
+            *fills,
+            realized_out,
+        )
+        self._qty = float(self._qty)
+        self._avg_price = float(self._avg_price)
+        self._realized_pnl = float(self._realized_pnl)
+        return realized_out
 
     def unrealized_pnl(self, current_price: float) -> float:
         """
@@ -97,59 +213,3 @@ class PositionManager:
             avg_price=self._avg_price,
             realized_pnl=self._realized_pnl,
         )
-
-    # ----------------- Internos ----------------- #
-
-    def _open_new_position(self, side: str, qty: float, price: float) -> None:
-        direction = 1 if side == "BUY" else -1
-        self._qty = direction * qty
-        self._avg_price = price
-
-    def _add_to_position(self, qty: float, price: float, direction: int) -> None:
-        """
-        Aumenta posição na mesma direção, ajustando o preço médio.
-        """
-        old_abs_qty = abs(self._qty)
-        new_abs_qty = old_abs_qty + qty
-
-        # preço médio ponderado
-        self._avg_price = (
-            (self._avg_price * old_abs_qty) + (price * qty)
-        ) / new_abs_qty
-
-        self._qty = direction * new_abs_qty
-
-    def _close_or_reverse(self, qty: float, price: float, trade_dir: int) -> None:
-        """
-        Fecha parcial/totalmente a posição existente.
-        Se a quantidade do trade for maior que a posição, reverte.
-        """
-        current_dir = 1 if self._qty > 0 else -1
-        abs_pos = abs(self._qty)
-        trade_qty = qty
-
-        # Quantidade que vai efetivamente fechar a posição atual
-        close_qty = min(abs_pos, trade_qty)
-
-        # PnL da parte fechada
-        pnl = (price - self._avg_price) * close_qty * current_dir
-        self._realized_pnl += pnl
-
-        if trade_qty == abs_pos:
-            # Fecha completamente e fica zerado
-            self._qty = 0.0
-            self._avg_price = 0.0
-            return
-
-        if trade_qty < abs_pos:
-            # Fecha parcial: sobra posição na direção original
-            remaining = abs_pos - trade_qty
-            self._qty = current_dir * remaining
-            # Preço médio da parte restante continua o mesmo
-            return
-
-        # trade_qty > abs_pos -> fecha tudo e abre posição na direção oposta
-        new_qty = trade_qty - abs_pos
-        new_dir = trade_dir  # direção do novo trade
-        self._qty = new_dir * new_qty
-        self._avg_price = price
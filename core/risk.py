@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskLimits:
     """Limites estáticos de risco – NÃO mudam durante o dia."""
     max_daily_loss_pct: float
@@ -28,6 +28,8 @@ class RiskManager:
     - Disparar circuit breaker quando necessário
     """
 
+    __slots__ = ("limits", "_daily_pnl", "_open_trades", "_circuit_breaker_hit")
+
     def __init__(self, limits: RiskLimits):
         self.limits = limits
         self._daily_pnl = 0.0
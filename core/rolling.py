@@ -0,0 +1,116 @@
+# core/rolling.py
+
+from array import array
+from math import sqrt
+
+
+class RollingStats:
+    """
+    Média e variância amostral de uma janela deslizante de floats, em O(1)
+    por valor (em vez de percorrer a janela inteira a cada tick).
+
+    - Anel pré-alocado em array('d'): floats contíguos, sem um objeto Python
+      por item.
+    - Welford deslizante: com a janela cheia, cada push() substitui o valor
+      mais antigo e ajusta média e M2 incrementalmente.
+    - Média e M2 são mantidos em relação a um pivô (a média da janela na
+      última ressincronização): com preços na casa de 1e5, os desvios
+      acumulados ficam pequenos e o erro de arredondamento não cresce com o
+      nível do preço.
+    - A cada volta completa do anel, pivô, média e M2 são recalculados do
+      zero (O(1) amortizado), para o erro de arredondamento não acumular.
+    - Janela com todos os valores iguais tem variância exatamente 0.
+    """
+
+    __slots__ = (
+        "window", "_ring", "_idx", "_count", "_pivot", "_mean", "_m2", "_same_run"
+    )
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window deve ser >= 1.")
+
+        self.window = int(window)
+        self._ring = array("d", bytes(8 * self.window))
+        self._idx = 0         # próxima posição de escrita (= mais antigo, se cheio)
+        self._count = 0
+        self._pivot = 0.0     # valores entram em média/M2 como x - pivô
+        self._mean = 0.0      # média de (x - pivô)
+        self._m2 = 0.0
+        self._same_run = 0    # nº de valores finais consecutivos iguais
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def full(self) -> bool:
+        return self._count == self.window
+
+    @property
+    def mean(self) -> float:
+        return self._pivot + self._mean
+
+    def deviation(self, x: float) -> float:
+        """
+        x - mean, calculado em relação ao pivô: evita o cancelamento de
+        subtrair dois números grandes e próximos (ex.: z-score de preços).
+        """
+        return (x - self._pivot) - self._mean
+
+    def push(self, x: float) -> None:
+        """Adiciona um valor; com a janela cheia, descarta o mais antigo."""
+        ring = self._ring
+        idx = self._idx
+        n = self._count
+
+        # ring[idx - 1] é o último valor gravado (idx 0 -> índice -1)
+        if n and x == ring[idx - 1]:
+            self._same_run += 1
+        else:
+            self._same_run = 1
+
+        if n == 0:
+            self._pivot = x
+        # o anel guarda o valor bruto; média e M2 usam o desvio ao pivô
+        y = x - self._pivot
+
+        if n < self.window:
+            n += 1
+            self._count = n
+            delta = y - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (y - self._mean)
+        else:
+            old = ring[idx] - self._pivot
+            old_mean = self._mean
+            new_mean = old_mean + (y - old) / n
+            self._m2 += (y - old) * (y - new_mean + old - old_mean)
+            self._mean = new_mean
+
+        ring[idx] = x
+        idx += 1
+        if idx == self.window:
+            idx = 0
+            if self._count == self.window:
+                self._resync()
+        self._idx = idx
+
+    def variance(self) -> float:
+        """Variância amostral (n - 1); 0 com menos de 2 valores."""
+        n = self._count
+        if n < 2 or self._same_run >= n:
+            return 0.0
+        m2 = self._m2
+        return m2 / (n - 1) if m2 > 0.0 else 0.0
+
+    def std(self) -> float:
+        return sqrt(self.variance())
+
+    def _resync(self) -> None:
+        ring = self._ring
+        n = self._count
+        pivot = sum(ring) / n
+        mean = sum(x - pivot for x in ring) / n
+        self._pivot = pivot
+        self._mean = mean
+        self._m2 = sum((x - pivot - mean) ** 2 for x in ring)
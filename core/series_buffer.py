@@ -0,0 +1,125 @@
+# core/series_buffer.py
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+
+class SeriesBuffer:
+    """
+    Histórico numérico por tick em formato SoA: um array float64
+    pré-alocado por coluna, em vez de um dict por tick.
+
+    - append() grava escalares direto nos arrays (sem alocar objetos).
+    - Os arrays começam pequenos e dobram de tamanho ao encher, até
+      `capacity`; sessões curtas não pagam a alocação máxima.
+    - Ao atingir `capacity`, descarta a metade mais antiga (janela
+      deslizante): o append segue O(1) amortizado e as colunas continuam
+      contíguas, então column() devolve uma view sem cópia.
+    """
+
+    def __init__(
+        self,
+        fields: tuple,
+        capacity: int,
+        initial_capacity: int = 4_096,
+    ):
+        self.fields = tuple(fields)
+        self.capacity = int(capacity)
+        allocated = max(1, min(int(initial_capacity), self.capacity))
+        self._columns = [np.empty(allocated, dtype=np.float64) for _ in self.fields]
+        self._index = {name: i for i, name in enumerate(self.fields)}
+        self.size = 0
+        self.total = 0  # linhas já gravadas, incluindo as descartadas
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, *values: float) -> None:
+        """Grava uma linha; valores na mesma ordem de `fields`."""
+        if self.size == len(self._columns[0]):
+            if self.size < self.capacity:
+                self._grow()
+            else:
+                self._keep_newest(self.size // 2)
+
+        i = self.size
+        for col, value in zip(self._columns, values):
+            col[i] = value
+        self.size = i + 1
+        self.total += 1
+
+    def extend(self, rows: List[tuple]) -> None:
+        """
+        Grava várias linhas de uma vez (tuplas na ordem de `fields`): uma
+        conversão em C para um bloco float64 e uma cópia por coluna, em vez
+        de um store escalar por campo.
+        """
+        if not rows:
+            return
+
+        block = np.array(rows, dtype=np.float64)
+        n = len(block)
+        self.total += n
+        if n > self.capacity:
+            block = block[-self.capacity :]
+            n = self.capacity
+
+        while self.size + n > len(self._columns[0]) and len(self._columns[0]) < self.capacity:
+            self._grow()
+        if self.size + n > self.capacity:
+            self._keep_newest(min(self.size // 2, self.capacity - n))
+
+        start, end = self.size, self.size + n
+        for j, col in enumerate(self._columns):
+            col[start:end] = block[:, j]
+        self.size = end
+
+    def column(self, name: str) -> np.ndarray:
+        return self._columns[self._index[name]][: self.size]
+
+    def last(self, name: str) -> float:
+        return float(self._columns[self._index[name]][self.size - 1])
+
+    def to_frame(self, tail: int | None = None, index: str | None = None) -> pd.DataFrame:
+        """
+        DataFrame com todas as linhas, ou só as `tail` mais recentes.
+
+        Com `index`, a coluna indicada vira o índice já na construção. As
+        linhas são gravadas em ordem de chegada (ts crescente), então não
+        há sort nem cópia extra de set_index.
+
+        Colunas e índice são views dos arrays (copy=False): o frame só vale
+        até o próximo append e não deve ser modificado.
+        """
+        start = 0 if tail is None else max(0, self.size - tail)
+        if index is None:
+            return pd.DataFrame(
+                {name: self.column(name)[start:] for name in self.fields},
+                copy=False,
+            )
+        return pd.DataFrame(
+            {
+                name: self.column(name)[start:]
+                for name in self.fields
+                if name != index
+            },
+            index=pd.Index(self.column(index)[start:], name=index, copy=False),
+            copy=False,
+        )
+
+    def _grow(self) -> None:
+        allocated = min(2 * len(self._columns[0]), self.capacity)
+        columns = []
+        for col in self._columns:
+            grown = np.empty(allocated, dtype=np.float64)
+            grown[: self.size] = col[: self.size]
+            columns.append(grown)
+        self._columns = columns
+
+    def _keep_newest(self, keep: int) -> None:
+        """Descarta as linhas mais antigas, mantendo as `keep` mais recentes."""
+        for col in self._columns:
+            col[:keep] = col[self.size - keep : self.size]
+        self.size = keep
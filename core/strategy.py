@@ -8,7 +8,7 @@ Side = Literal["BUY", "SELL"]
 OrderType = Literal["MARKET", "LIMIT"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """
     Representa uma intenção de ordem da estratégia.
@@ -25,6 +25,8 @@ class StrategyBase(ABC):
     Classe base para qualquer estratégia.
     """
 
+    __slots__ = ("symbol",)
+
     def __init__(self, symbol: str):
         self.symbol = symbol
 
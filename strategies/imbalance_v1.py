@@ -9,7 +9,7 @@ from core.strategy import StrategyBase, Signal
 SideBias = Literal["both", "long_only", "short_only"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImbalanceV1Config:
     """
     Estratégia Imbalance V1:
@@ -29,6 +29,8 @@ class ImbalanceV1Config:
 
 
 class ImbalanceV1(StrategyBase):
+    __slots__ = ("cfg", "_cooldown_counter")
+
     def __init__(self, symbol: str, config: Optional[ImbalanceV1Config] = None):
         super().__init__(symbol)
         self.cfg = config or ImbalanceV1Config()
@@ -62,14 +64,17 @@ class ImbalanceV1(StrategyBase):
         if total_size <= 0 or total_size < self.cfg.min_total_size:
             return []
 
-        imbalance = (bid_size - ask_size) / total_size
+        # |d / total| < thr  <=>  -thr * total < d < thr * total  (total > 0),
+        # sem divisão nem abs()
+        diff = bid_size - ask_size
+        lim = self.cfg.imbalance_threshold * total_size
 
         # nada relevante
-        if abs(imbalance) < self.cfg.imbalance_threshold:
+        if -lim < diff < lim:
             return []
 
         # decide lado
-        if imbalance > 0:
+        if diff > 0:
             side = "BUY"
         else:
             side = "SELL"
@@ -6,7 +6,7 @@ from typing import Optional, Dict, Any, List
 from core.strategy import StrategyBase, Signal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarketMakerV1Config:
     """
     Configuração básica do Market Maker v1.
@@ -29,12 +29,30 @@ class MarketMakerV1(StrategyBase):
     - Versão simplificada: não faz gestão de cancelamento, assume fill imediato
       (na prática teremos que evoluir para acompanhar ordens abertas).
     - Inventory risk é tratado externamente pelo InventoryRiskManager.
+    - Os dois Signals são criados uma vez e reaproveitados (só o preço muda a
+      cada quote); quem consome deve usá-los no próprio tick, sem guardá-los.
     """
 
+    __slots__ = ("cfg", "_counter", "_bid_signal", "_ask_signal")
+
     def __init__(self, symbol: str, config: Optional[MarketMakerV1Config] = None):
         super().__init__(symbol)
         self.cfg = config or MarketMakerV1Config()
         self._counter = 0
+        self._bid_signal = Signal(
+            side="BUY",
+            size=self.cfg.quote_size,
+            order_type="LIMIT",
+            price=None,
+            tag="MM_BID",
+        )
+        self._ask_signal = Signal(
+            side="SELL",
+            size=self.cfg.quote_size,
+            order_type="LIMIT",
+            price=None,
+            tag="MM_ASK",
+        )
 
     def on_tick(self, tick: Dict[str, Any]) -> List[Signal]:
         self._counter += 1
@@ -58,24 +76,9 @@ class MarketMakerV1(StrategyBase):
         # Aplica limites
         desired_spread = max(self.cfg.min_spread, min(base_spread, self.cfg.max_spread))
 
-        quote_bid = mid - desired_spread / 2.0
-        quote_ask = mid + desired_spread / 2.0
-
-        # Gera dois sinais: buy no bid, sell no ask
-        signals: List[Signal] = [
-            Signal(
-                side="BUY",
-                size=self.cfg.quote_size,
-                order_type="LIMIT",
-                price=quote_bid,
-                tag="MM_BID",
-            ),
-            Signal(
-                side="SELL",
-                size=self.cfg.quote_size,
-                order_type="LIMIT",
-                price=quote_ask,
-                tag="MM_ASK",
-            ),
-        ]
-        return signals
+        # Dois sinais: buy no bid, sell no ask (objetos reaproveitados)
+        bid_signal = self._bid_signal
+        ask_signal = self._ask_signal
+        bid_signal.price = mid - desired_spread / 2.0
+        ask_signal.price = mid + desired_spread / 2.0
+        return [bid_signal, ask_signal]
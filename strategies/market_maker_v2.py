@@ -1,13 +1,13 @@
 # strategies/market_maker_v2.py
 
 from dataclasses import dataclass
-from collections import deque
 from typing import Optional, Dict, Any, List
 
+from core.rolling import RollingStats
 from core.strategy import StrategyBase, Signal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarketMakerV2Config:
     """
     Market Maker adaptativo com base na volatilidade recente do mid-price.
@@ -35,27 +35,24 @@ class MarketMakerV2(StrategyBase):
     - Inventory e risco global são tratados fora (InventoryRiskManager e RiskManager).
     """
 
+    __slots__ = ("cfg", "_counter", "_mids")
+
     def __init__(self, symbol: str, config: Optional[MarketMakerV2Config] = None):
         super().__init__(symbol)
         self.cfg = config or MarketMakerV2Config()
         self._counter = 0
-        self._mid_history: deque[float] = deque(maxlen=self.cfg.vol_window)
+        # mids recentes com média/variância atualizadas em O(1) por tick
+        self._mids = RollingStats(self.cfg.vol_window)
 
     def _update_mid_history(self, mid: float) -> None:
-        self._mid_history.append(mid)
+        self._mids.push(mid)
 
     def _calc_volatility(self) -> float:
         """
         Volatilidade simples = desvio padrão dos mids salvos.
         Se não há dados suficientes, retorna 0.
         """
-        n = len(self._mid_history)
-        if n < 2:
-            return 0.0
-
-        mean = sum(self._mid_history) / n
-        var = sum((x - mean) ** 2 for x in self._mid_history) / (n - 1)
-        return var ** 0.5
+        return self._mids.std()
 
     def on_tick(self, tick: Dict[str, Any]) -> List[Signal]:
         self._counter += 1
@@ -1,21 +1,21 @@
 # strategies/mean_reversion_v1.py
 
 from dataclasses import dataclass
-from collections import deque
 from typing import Optional, Dict, Any, List, Literal
 
+from core.rolling import RollingStats
 from core.strategy import StrategyBase, Signal
 
 
 SideBias = Literal["both", "long_only", "short_only"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MeanReversionV1Config:
     """
     Mean Reversion Microestrutural V1:
     - Observa últimos N preços "last".
-    - Calcula média e desvio padrão.
+    - Calcula média e desvio padrão (janela deslizante, O(1) por tick).
     - Calcula z-score = (last - mean) / std.
     - Se z <= -z_threshold -> BUY (preço abaixo da média).
     - Se z >=  z_threshold -> SELL (preço acima da média).
@@ -30,14 +30,16 @@ class MeanReversionV1Config:
 
 
 class MeanReversionV1(StrategyBase):
+    __slots__ = ("cfg", "_prices", "_cooldown_counter")
+
     def __init__(self, symbol: str, config: Optional[MeanReversionV1Config] = None):
         super().__init__(symbol)
         self.cfg = config or MeanReversionV1Config()
-        self._prices: deque[float] = deque(maxlen=self.cfg.lookback_ticks)
+        self._prices = RollingStats(self.cfg.lookback_ticks)
         self._cooldown_counter: int = 0
 
     def _update_price_history(self, price: float) -> None:
-        self._prices.append(price)
+        self._prices.push(price)
 
     def _bias_allows(self, side: str) -> bool:
         if self.cfg.side_bias == "both":
@@ -49,24 +51,19 @@ class MeanReversionV1(StrategyBase):
         return False
 
     def _enough_data(self) -> bool:
-        return len(self._prices) >= self.cfg.lookback_ticks
+        return self._prices.full
 
     def _compute_z_score(self, last: float) -> Optional[float]:
         if not self._enough_data():
             return None
 
-        prices = list(self._prices)
-        n = len(prices)
-        mean = sum(prices) / n
-
-        # desvio padrão
-        var = sum((p - mean) ** 2 for p in prices) / max(1, (n - 1))
-        std = var ** 0.5
+        # média e desvio padrão mantidos incrementalmente a cada push()
+        std = self._prices.std()
 
         if std <= 0:
             return None
 
-        z = (last - mean) / std
+        z = self._prices.deviation(last) / std
 
         # limita z-score
         if z > self.cfg.max_z_cap:
@@ -10,7 +10,7 @@ from core.strategy import StrategyBase, Signal
 SideBias = Literal["both", "long_only", "short_only"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MicroMomentumV1Config:
     """
     Estratégia de Micro-Momentum:
@@ -30,14 +30,32 @@ class MicroMomentumV1Config:
 
 
 class MicroMomentumV1(StrategyBase):
+    __slots__ = ("cfg", "_last_prices", "_up_moves", "_down_moves", "_cooldown_counter")
+
     def __init__(self, symbol: str, config: Optional[MicroMomentumV1Config] = None):
         super().__init__(symbol)
         self.cfg = config or MicroMomentumV1Config()
         self._last_prices: deque[float] = deque(maxlen=self.cfg.lookback_ticks)
+        # movimentos consecutivos no fim do histórico, mantidos a cada tick
+        self._up_moves: int = 0
+        self._down_moves: int = 0
         self._cooldown_counter: int = 0
 
     def _update_price_history(self, price: float) -> None:
-        self._last_prices.append(price)
+        prices = self._last_prices
+        if prices:
+            prev = prices[-1]
+            if price > prev:
+                self._up_moves += 1
+                self._down_moves = 0
+            elif price < prev:
+                self._down_moves += 1
+                self._up_moves = 0
+            else:
+                # preço igual zera ambos
+                self._up_moves = 0
+                self._down_moves = 0
+        prices.append(price)
 
     def _enough_data(self) -> bool:
         return len(self._last_prices) >= self.cfg.lookback_ticks
@@ -52,7 +70,7 @@ class MicroMomentumV1(StrategyBase):
         if not self._enough_data():
             return None
 
-        prices = list(self._last_prices)
+        prices = self._last_prices
         p0 = prices[0]
         pN = prices[-1]
 
@@ -62,20 +80,10 @@ class MicroMomentumV1(StrategyBase):
         # retorno relativo total
         ret = (pN - p0) / p0
 
-        # conta movimentos consecutivos
-        up_moves = 0
-        down_moves = 0
-        for i in range(1, len(prices)):
-            if prices[i] > prices[i - 1]:
-                up_moves += 1
-                down_moves = 0
-            elif prices[i] < prices[i - 1]:
-                down_moves += 1
-                up_moves = 0
-            else:
-                # preço igual zera ambos
-                up_moves = 0
-                down_moves = 0
+        # movimentos consecutivos dentro da janela (no máximo N - 1)
+        max_moves = len(prices) - 1
+        up_moves = min(self._up_moves, max_moves)
+        down_moves = min(self._down_moves, max_moves)
 
         # verifica tendência para cima
         if (
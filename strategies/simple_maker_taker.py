@@ -6,7 +6,7 @@ from typing import Optional, Dict, Any, List
 from core.strategy import StrategyBase, Signal, Side, OrderType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimpleMakerTakerConfig:
     min_spread: float = 1.0      # spread mínimo em unidades de preço
     order_size: float = 0.001    # quantidade de BTC (por exemplo)
@@ -20,6 +20,8 @@ class SimpleMakerTakerStrategy(StrategyBase):
     - Se o spread >= min_spread, manda UMA ordem LIMIT alternando BUY/SELL.
     """
 
+    __slots__ = ("cfg", "_counter", "_last_side")
+
     def __init__(self, symbol: str, config: Optional[SimpleMakerTakerConfig] = None):
         super().__init__(symbol)
         self.cfg = config or SimpleMakerTakerConfig()
@@ -1,12 +1,18 @@
 # streamlit_app.py
 
-from typing import List, Dict, Any
+import os
+from collections import deque, namedtuple
+from dataclasses import dataclass
+from itertools import islice
+from typing import List, Dict, Any, Tuple
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 
 from app import (
     load_settings,
+    resolve_config_path,
     build_strategy,
     build_risk_manager,
     build_inventory_manager,
@@ -14,13 +20,213 @@ from app import (
     build_execution_client,
 )
 from core.engine import TradingEngine, EngineEvent
+from core.metrics import max_drawdown
 from core.position import PositionManager
+from core.series_buffer import SeriesBuffer
+
+
+# Capacidade (em ticks) dos históricos numéricos mantidos na sessão
+HISTORY_CAPACITY = 100_000
+# Capacidade inicial dos arrays do histórico (dobra até HISTORY_CAPACITY)
+HISTORY_INITIAL_CAPACITY = 4_096
+# Nº máximo de eventos guardados no log da sessão
+EVENT_LOG_MAXLEN = 20_000
+# Nº de linhas mais recentes materializadas em cada gráfico/tabela
+RENDER_ROWS = 5_000
+# Nº máximo de pontos enviados ao frontend por gráfico
+CHART_POINTS = 2_000
+# Avisos (st.warning/st.error) emitidos por lote de ticks
+MAX_ALERTS_PER_BATCH = 5
+# Intervalo (s) entre passos no modo "Rodar automaticamente"
+AUTO_RUN_INTERVAL = 0.5
+
+PRICE_FIELDS = ("ts", "last", "bid", "ask", "bid_size", "ask_size")
+# equity não é gravada: é sempre initial_equity + realized_pnl
+PNL_FIELDS = ("ts", "realized_pnl")
+# Linha do log de eventos: tupla leve, só vira DataFrame ao renderizar
+EventRow = namedtuple("EventRow", "ts type msg tag")
+
+
+# Opções fixas dos seletores da sidebar e seus índices, montados uma vez no
+# import (e não a cada rerun)
+ENV_LABEL_TO_NAME: Dict[str, str] = {
+    "LAB / Dummy": "lab_dummy",
+    "Binance Testnet": "binance_testnet",
+    "Binance LIVE": "binance_live",
+}
+ENV_LABELS = tuple(ENV_LABEL_TO_NAME)
+ENV_LABEL_INDEX = {label: i for i, label in enumerate(ENV_LABELS)}
+
+DUMMY_DATAFEED_OPTIONS = ("dummy", "dummy_orderbook")
+DUMMY_DATAFEED_INDEX = {name: i for i, name in enumerate(DUMMY_DATAFEED_OPTIONS)}
+
+SIDE_BIAS_OPTIONS = ("both", "long_only", "short_only")
+SIDE_BIAS_INDEX = {name: i for i, name in enumerate(SIDE_BIAS_OPTIONS)}
+
+
+@dataclass(frozen=True, slots=True)
+class ParamSpec:
+    """
+    Parâmetro editável de estratégia na sidebar.
+
+    cast `str` vira selectbox de SIDE_BIAS_OPTIONS; os demais, number_input.
+    """
+
+    key: str
+    cast: type
+    default: float | int | str
+    step: float | int | None = None
+    fmt: str | None = None
+    min_value: float | int | None = None
+
+
+# Parâmetros editáveis de cada estratégia: nome -> (título, [ParamSpec, ...])
+STRATEGY_PARAM_SCHEMA: Dict[str, Tuple[str, List[ParamSpec]]] = {
+    "simple_maker_taker": (
+        "Simple Maker/Taker",
+        [
+            ParamSpec("min_spread", float, 1.0, step=0.1),
+            ParamSpec("order_size", float, 0.001, step=0.0001, fmt="%.6f"),
+            ParamSpec("tick_interval", int, 5, step=1, min_value=1),
+        ],
+    ),
+    "market_maker_v1": (
+        "Market Maker V1",
+        [
+            ParamSpec("min_spread", float, 1.0, step=0.1),
+            ParamSpec("max_spread", float, 10.0, step=0.1),
+            ParamSpec("spread_pct", float, 0.0, step=0.0001, fmt="%.4f"),
+            ParamSpec("quote_size", float, 0.001, step=0.0001, fmt="%.6f"),
+            ParamSpec("tick_interval", int, 5, step=1, min_value=1),
+        ],
+    ),
+    "market_maker_v2": (
+        "Market Maker V2 (adaptativo)",
+        [
+            ParamSpec("min_spread", float, 1.0, step=0.1),
+            ParamSpec("max_spread", float, 15.0, step=0.1),
+            ParamSpec("spread_pct", float, 0.0, step=0.0001, fmt="%.4f"),
+            ParamSpec("quote_size", float, 0.001, step=0.0001, fmt="%.6f"),
+            ParamSpec("tick_interval", int, 5, step=1, min_value=1),
+            ParamSpec("vol_window", int, 50, step=1, min_value=5),
+            ParamSpec("vol_factor", float, 1.0, step=0.1),
+        ],
+    ),
+    "micro_momentum_v1": (
+        "Micro Momentum V1",
+        [
+            ParamSpec("lookback_ticks", int, 10, step=1, min_value=3),
+            ParamSpec("min_moves", int, 3, step=1, min_value=1),
+            ParamSpec("min_return", float, 0.0005, step=0.0001, fmt="%.4f"),
+            ParamSpec("order_size", float, 0.001, step=0.0001, fmt="%.6f"),
+            ParamSpec("cooldown_ticks", int, 10, step=1, min_value=0),
+            ParamSpec("side_bias", str, "both"),
+        ],
+    ),
+    "imbalance_v1": (
+        "Imbalance V1",
+        [
+            ParamSpec("imbalance_threshold", float, 0.6, step=0.05),
+            ParamSpec("min_total_size", float, 1.0, step=0.1),
+            ParamSpec("imbalance_order_size", float, 0.001, step=0.0001, fmt="%.6f"),
+            ParamSpec("imbalance_cooldown_ticks", int, 5, step=1, min_value=0),
+            ParamSpec("imbalance_side_bias", str, "both"),
+        ],
+    ),
+    "mean_reversion_v1": (
+        "Mean Reversion V1",
+        [
+            ParamSpec("mr_lookback_ticks", int, 20, step=1, min_value=5),
+            ParamSpec("mr_z_threshold", float, 2.0, step=0.1),
+            ParamSpec("mr_order_size", float, 0.001, step=0.0001, fmt="%.6f"),
+            ParamSpec("mr_cooldown_ticks", int, 10, step=1, min_value=0),
+            ParamSpec("mr_side_bias", str, "both"),
+            ParamSpec("mr_max_z_cap", float, 5.0, step=0.5),
+        ],
+    ),
+}
+
+STRATEGY_OPTIONS = tuple(STRATEGY_PARAM_SCHEMA)
+STRATEGY_INDEX = {name: i for i, name in enumerate(STRATEGY_OPTIONS)}
+
+# Visões da área principal (só a selecionada é montada a cada rerun)
+VIEW_PRICE = "📈 Preço & Book"
+VIEW_PNL = "💰 PnL / Equity"
+VIEW_TRADES = "📜 Trades"
+VIEW_SIGNALS = "📡 Sinais"
+VIEW_EVENTS = "📝 Eventos"
+VIEWS = (VIEW_PRICE, VIEW_PNL, VIEW_TRADES, VIEW_SIGNALS, VIEW_EVENTS)
+
+
+# =====================================================================
+# Histórico por tick (SoA)
+# =====================================================================
+
+def tick_row(tick: Dict[str, Any]) -> tuple:
+    """
+    Extrai do tick, numa única passada, os campos numéricos gravados em
+    price_history (ordem de PRICE_FIELDS). bid/ask ausentes caem no last.
+
+    Os datafeeds já emitem floats e a gravação nos arrays float64 converte o
+    que for preciso, então não há float() por campo aqui.
+    """
+    get = tick.get
+    last = get("last", 0.0)
+    return (
+        get("ts", 0.0),
+        last,
+        get("bid", last),
+        get("ask", last),
+        get("bid_size", 0.0),
+        get("ask_size", 0.0),
+    )
+
+
+def downsample(df: pd.DataFrame, max_points: int = CHART_POINTS) -> pd.DataFrame:
+    """
+    Reduz o DataFrame a ~max_points linhas por passo fixo, ancorado na
+    última linha (o ponto mais recente sempre aparece no gráfico).
+    """
+    if len(df) <= max_points:
+        return df
+    step = -(-len(df) // max_points)  # ceil
+    return df.iloc[::-step].iloc[::-1]
 
 
 # =====================================================================
 # Helpers de inicialização e processamento
 # =====================================================================
 
+def load_settings_cached(env_name: str) -> Dict[str, Any]:
+    """
+    Settings do ambiente. O YAML só é relido quando o arquivo muda (mtime).
+
+    st.cache_data devolve uma cópia a cada chamada, então alterar o dict
+    retornado não afeta outras sessões.
+    """
+    try:
+        mtime = os.path.getmtime(resolve_config_path(env_name))
+    except OSError:
+        mtime = 0.0  # load_settings acusa o arquivo ausente
+    return _load_settings_for_mtime(env_name, mtime)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _load_settings_for_mtime(env_name: str, mtime: float) -> Dict[str, Any]:
+    return load_settings(env_name_override=env_name)
+
+
+def close_data_iter() -> None:
+    """
+    Fecha o generator de ticks da sessão, se houver. Os datafeeds desconectam
+    no `finally` de ticks() (no WebSocket, isso encerra a thread de fundo),
+    então um reset não deixa conexões órfãs para trás.
+    """
+    data_iter = st.session_state.pop("data_iter", None)
+    if data_iter is not None:
+        data_iter.close()
+
+
 def init_engine_and_data(
     strategy_cfg: Dict[str, Any],
     env_name: str,
@@ -33,7 +239,7 @@ def init_engine_and_data(
     - Aplica exchange_override (apenas para provider dummy).
     - Cria TradingEngine, datafeed e iterador de ticks.
     """
-    settings = load_settings(env_name_override=env_name)
+    settings = load_settings_cached(env_name)
 
     base_exchange_cfg = settings["exchange"]
     risk_cfg = settings["risk"]
@@ -65,6 +271,8 @@ def init_engine_and_data(
         raise_on_circuit_breaker=False,
     )
 
+    close_data_iter()
+
     datafeed = build_datafeed(exchange_cfg)
     data_iter = datafeed.ticks()
 
@@ -73,10 +281,27 @@ def init_engine_and_data(
     st.session_state.data_iter = data_iter
 
     # históricos p/ gráficos
-    st.session_state.price_history: List[Dict[str, float]] = []
-    st.session_state.pnl_history: List[Dict[str, float]] = []
+    st.session_state.price_history = SeriesBuffer(
+        PRICE_FIELDS, HISTORY_CAPACITY, HISTORY_INITIAL_CAPACITY
+    )
+    st.session_state.pnl_history = SeriesBuffer(
+        PNL_FIELDS, HISTORY_CAPACITY, HISTORY_INITIAL_CAPACITY
+    )
     st.session_state.trades: List[Dict[str, Any]] = []
-    st.session_state.event_log: List[Dict[str, Any]] = []
+    st.session_state.event_log = deque(maxlen=EVENT_LOG_MAXLEN)
+
+    # DataFrames das abas, refeitos só quando chegam dados novos
+    st.session_state.trades_df = None
+    st.session_state.trades_df_len = 0
+    st.session_state.events_df = None
+    st.session_state.events_df_version = -1
+    st.session_state.chart_frames = {}
+    st.session_state.metrics = None
+    st.session_state.metrics_version = None
+
+    # pico e maior drawdown do PnL na sessão inteira (ver _update_drawdown)
+    st.session_state.pnl_peak = None
+    st.session_state.pnl_max_drawdown = 0.0
 
     # equity fictícia para lab (1000 + realized_pnl)
     st.session_state.initial_equity = 1000.0
@@ -85,6 +310,67 @@ def init_engine_and_data(
     st.session_state.exchange_effective_cfg = exchange_cfg
 
 
+# ---------------------------------------------------------------------
+# Handlers de EngineEvent, indexados por ev.type.
+# Recebem (data, ts, estado da sessão, alerts) e retornam True para
+# interromper o lote de ticks. Avisos para a UI vão para `alerts` e são
+# emitidos uma vez ao fim do lote, não a cada tick.
+# ---------------------------------------------------------------------
+
+def _on_trade_executed(data: Dict[str, Any], ts: float, state, alerts) -> bool:
+    state.trades.append(data)
+    state.event_log.append(
+        EventRow(
+            ts,
+            "trade_executed",
+            f"{data['side']} {data['size']} @ {data['price']}",
+            data.get("signal_tag"),
+        )
+    )
+    return False
+
+
+def _on_signal_rejected(data: Dict[str, Any], ts: float, state, alerts) -> bool:
+    state.event_log.append(
+        EventRow(
+            ts,
+            "signal_rejected",
+            f"{data.get('reason', '')} – {data.get('error', '')}",
+            data.get("signal_tag"),
+        )
+    )
+    return False
+
+
+def _on_circuit_breaker(data: Dict[str, Any], ts: float, state, alerts) -> bool:
+    state.event_log.append(
+        EventRow(ts, "circuit_breaker", data.get("message", ""), None)
+    )
+    alerts.append((st.warning, f"Circuit breaker disparado: {data.get('message')}"))
+    return True
+
+
+def _on_error(data: Dict[str, Any], ts: float, state, alerts) -> bool:
+    state.event_log.append(
+        EventRow(ts, "error", data.get("message", ""), data.get("signal_tag"))
+    )
+    alerts.append((st.error, f"Erro na engine: {data.get('message')}"))
+    return False
+
+
+def _noop(data: Dict[str, Any], ts: float, state, alerts) -> bool:
+    """Tipos de evento sem tratamento na UI."""
+    return False
+
+
+EVENT_HANDLERS = {
+    "trade_executed": _on_trade_executed,
+    "signal_rejected": _on_signal_rejected,
+    "circuit_breaker": _on_circuit_breaker,
+    "error": _on_error,
+}
+
+
 def process_n_ticks(n: int) -> None:
     """
     Processa N ticks usando o engine e atualiza históricos.
@@ -95,96 +381,104 @@ def process_n_ticks(n: int) -> None:
 
     engine: TradingEngine = st.session_state.engine
     data_iter = st.session_state.data_iter
+    state = st.session_state
+    alerts: List[Tuple[Any, str]] = []
+
+    try:
+        _run_ticks(engine, data_iter, state, alerts, n)
+    finally:
+        # Só os últimos avisos do lote chegam ao front-end
+        for emit, msg in alerts[-MAX_ALERTS_PER_BATCH:]:
+            emit(msg)
+
+
+def _run_ticks(engine: TradingEngine, data_iter, state, alerts, n: int) -> None:
+    """Laço quente de process_n_ticks; para cedo no circuit breaker."""
+    # Nomes usados a cada tick presos em locais (LOAD_FAST no laço)
+    process_tick = engine.process_tick
+    position = engine.position
+    get_handler = EVENT_HANDLERS.get
+    noop = _noop
+
+    # Linhas do lote acumuladas como tuplas e gravadas nos históricos de uma
+    # vez no fim (inclusive na saída antecipada do circuit breaker)
+    price_rows: List[tuple] = []
+    pnl_rows: List[tuple] = []
+    price_row_append = price_rows.append
+    pnl_row_append = pnl_rows.append
+
+    try:
+        for tick in islice(data_iter, n):
+            events: List[EngineEvent] = process_tick(tick)
+
+            # Histórico de preço + book
+            row = tick_row(tick)
+            ts = row[0]
+            price_row_append(row)
+
+            # PnL (leitura direta; o snapshot completo só é montado uma vez
+            # por rerun, para a sidebar)
+            pnl_row_append((ts, position.realized_pnl))
+
+            # Eventos
+            for ev in events:
+                if get_handler(ev.type, noop)(ev.data, ts, state, alerts):
+                    return
+
+        if len(price_rows) < n:
+            alerts.append((st.warning, "Datafeed chegou ao fim (StopIteration)."))
+    finally:
+        state.price_history.extend(price_rows)
+        state.pnl_history.extend(pnl_rows)
+        if pnl_rows:
+            _update_drawdown(state, pnl_rows)
+
+
+def _update_drawdown(state, pnl_rows: List[tuple]) -> None:
+    """
+    Atualiza pico e maior drawdown da sessão inteira com o PnL do lote.
 
-    for _ in range(n):
-        try:
-            tick = next(data_iter)
-        except StopIteration:
-            st.warning("Datafeed chegou ao fim (StopIteration).")
-            break
-
-        events: List[EngineEvent] = engine.process_tick(tick)
-        snap = engine.snapshot()
-
-        ts = float(tick.get("ts", 0.0))
-        last_price = float(tick.get("last", 0.0))
-
-        bid = float(tick.get("bid", last_price))
-        ask = float(tick.get("ask", last_price))
-        bid_size = float(tick.get("bid_size", 0.0))
-        ask_size = float(tick.get("ask_size", 0.0))
-
-        # Histórico de preço + book
-        st.session_state.price_history.append(
-            {
-                "ts": ts,
-                "last": last_price,
-                "bid": bid,
-                "ask": ask,
-                "bid_size": bid_size,
-                "ask_size": ask_size,
-            }
-        )
-
-        # PnL / equity
-        realized_pnl = float(snap["position"]["realized_pnl"])
-        equity = st.session_state.initial_equity + realized_pnl
-
-        st.session_state.pnl_history.append(
-            {"ts": ts, "realized_pnl": realized_pnl, "equity": equity}
-        )
+    O(lote) e independente da janela retida em pnl_history (que descarta as
+    linhas mais antigas ao encher): o pico anterior entra como primeiro ponto
+    da curva do lote.
+    """
+    curve = np.empty(len(pnl_rows) + 1, dtype=np.float64)
+    curve[1:] = [row[1] for row in pnl_rows]
+    curve[0] = curve[1] if state.pnl_peak is None else state.pnl_peak
 
-        # Eventos
-        for ev in events:
-            if ev.type == "trade_executed":
-                st.session_state.trades.append(ev.data)
-                st.session_state.event_log.append(
-                    {
-                        "ts": ts,
-                        "type": "trade_executed",
-                        "msg": f"{ev.data['side']} {ev.data['size']} @ {ev.data['price']}",
-                        "tag": ev.data.get("signal_tag"),
-                    }
-                )
-            elif ev.type == "signal_rejected":
-                st.session_state.event_log.append(
-                    {
-                        "ts": ts,
-                        "type": "signal_rejected",
-                        "msg": f"{ev.data.get('reason', '')} – {ev.data.get('error', '')}",
-                        "tag": ev.data.get("signal_tag"),
-                    }
-                )
-            elif ev.type == "circuit_breaker":
-                st.session_state.event_log.append(
-                    {
-                        "ts": ts,
-                        "type": "circuit_breaker",
-                        "msg": ev.data.get("message", ""),
-                        "tag": None,
-                    }
-                )
-                st.warning(f"Circuit breaker disparado: {ev.data.get('message')}")
-                return
-            elif ev.type == "error":
-                st.session_state.event_log.append(
-                    {
-                        "ts": ts,
-                        "type": "error",
-                        "msg": ev.data.get("message", ""),
-                        "tag": ev.data.get("signal_tag"),
-                    }
-                )
-                st.error(f"Erro na engine: {ev.data.get('message')}")
+    state.pnl_max_drawdown = max(state.pnl_max_drawdown, max_drawdown(curve))
+    state.pnl_peak = float(curve.max())
 
 
 def compute_metrics() -> Dict[str, float]:
     """
     Calcula métricas básicas a partir dos trades e da curva de PnL.
+
+    Memoizado no session_state da própria sessão (st.cache_data seria
+    compartilhado entre sessões): os históricos só crescem por append, então
+    (nº de trades, linhas gravadas) identifica o conteúdo e reruns sem ticks
+    novos (cliques em widgets) reaproveitam o dict.
+    O drawdown é o da sessão inteira, mantido por _update_drawdown: como a
+    equity é initial_equity + PnL, o drawdown absoluto das duas curvas é o
+    mesmo.
     """
-    trades = st.session_state.get("trades", [])
-    pnl_hist = st.session_state.get("pnl_history", [])
+    state = st.session_state
+    trades = state.get("trades", [])
+    pnl_hist = state.get("pnl_history")
+
+    version = (len(trades), pnl_hist.total if pnl_hist else 0)
+    if state.get("metrics_version") != version:
+        state.metrics = _compute_metrics(trades, state.get("pnl_max_drawdown", 0.0))
+        state.metrics_version = version
 
+    return state.metrics
+
+
+def _compute_metrics(
+    trades: List[Dict[str, Any]],
+    max_dd: float,
+) -> Dict[str, float]:
+    """Cálculo puro das métricas."""
     total_trades = len(trades)
     if total_trades == 0:
         return {
@@ -194,21 +488,14 @@ def compute_metrics() -> Dict[str, float]:
             "total_trades": 0,
         }
 
-    pnls = [float(t.get("trade_pnl", 0.0)) for t in trades]
-    wins = sum(1 for x in pnls if x > 0)
-    win_rate = (wins / total_trades) * 100.0 if total_trades > 0 else 0.0
-    net_pnl = sum(pnls)
-
-    max_dd = 0.0
-    if pnl_hist:
-        eq_series = [row["equity"] for row in pnl_hist]
-        max_eq = eq_series[0]
-        for eq in eq_series:
-            if eq > max_eq:
-                max_eq = eq
-            dd = max_eq - eq
-            if dd > max_dd:
-                max_dd = dd
+    pnls = np.fromiter(
+        (t.get("trade_pnl", 0.0) for t in trades),
+        dtype=np.float64,
+        count=total_trades,
+    )
+    wins = int((pnls > 0).sum())
+    win_rate = (wins / total_trades) * 100.0
+    net_pnl = float(pnls.sum())
 
     return {
         "net_pnl": net_pnl,
@@ -218,37 +505,206 @@ def compute_metrics() -> Dict[str, float]:
     }
 
 
+def trades_frame() -> pd.DataFrame:
+    """
+    DataFrame dos trades da sessão. Como `trades` só cresce por append,
+    apenas os trades novos desde o último rerun são convertidos e concatenados.
+    """
+    trades = st.session_state.trades
+    done = st.session_state.trades_df_len
+
+    if len(trades) > done:
+        new_df = pd.DataFrame(trades[done:])
+        old_df = st.session_state.trades_df
+        st.session_state.trades_df = (
+            new_df if old_df is None else pd.concat([old_df, new_df], ignore_index=True)
+        )
+        st.session_state.trades_df_len = len(trades)
+
+    return st.session_state.trades_df
+
+
+def events_frame() -> pd.DataFrame:
+    """
+    Últimos RENDER_ROWS eventos, do mais recente para o mais antigo.
+
+    O log já está em ordem de ts, então basta percorrê-lo ao contrário (sem
+    sort). O DataFrame só é refeito quando novos ticks foram processados.
+    """
+    version = st.session_state.pnl_history.total
+    if st.session_state.events_df_version != version:
+        event_log = st.session_state.event_log
+        st.session_state.events_df = pd.DataFrame.from_records(
+            list(islice(reversed(event_log), RENDER_ROWS)),
+            columns=EventRow._fields,
+        )
+        st.session_state.events_df_version = version
+
+    return st.session_state.events_df
+
+
+def chart_frame(name: str) -> pd.DataFrame:
+    """
+    Janela de gráfico (últimas RENDER_ROWS linhas, já em downsample e
+    indexadas por ts) de `price_history` ou `pnl_history`.
+
+    Guardada pela versão do histórico: reruns sem ticks novos reaproveitam
+    o mesmo DataFrame, e os blocos que o consomem leem as colunas sem cópia.
+    """
+    history = st.session_state[name]
+    cache = st.session_state.chart_frames
+    version = history.total
+
+    hit = cache.get(name)
+    if hit is None or hit[0] != version:
+        hit = (version, downsample(history.to_frame(tail=RENDER_ROWS, index="ts")))
+        cache[name] = hit
+
+    return hit[1]
+
+
 # =====================================================================
 # UI Principal
 # =====================================================================
 
+def render_dashboard(auto_ticks: int = 0) -> None:
+    """
+    Métricas e visão ativa da área principal.
+
+    Roda como st.fragment: no modo automático, processa `auto_ticks` ticks e
+    redesenha só este trecho a cada AUTO_RUN_INTERVAL segundos, sem rerun da
+    página inteira (sidebar, settings, widgets).
+
+    Num rerun da página inteira o fragmento também executa; main() marca
+    esse caso em `dashboard_full_run` e aí nenhum tick é consumido (o passo
+    manual, o reset e os forms já cuidam do engine naquele rerun).
+    """
+    full_run = st.session_state.pop("dashboard_full_run", False)
+    if auto_ticks and not full_run:
+        process_n_ticks(auto_ticks)
+
+    # Métricas gerais (header)
+    metrics = compute_metrics()
+    st.subheader("📊 Métricas gerais do robô (sessão atual)")
+
+    mc1, mc2, mc3, mc4 = st.columns(4)
+    mc1.metric("PnL líquido", f"{metrics['net_pnl']:.4f}")
+    mc2.metric("Win rate", f"{metrics['win_rate']:.2f}%")
+    mc3.metric("Max Drawdown", f"{metrics['max_drawdown']:.4f}")
+    mc4.metric("Trades", metrics["total_trades"])
+
+    st.markdown("---")
+
+    # Visões principais
+    # st.tabs executa o corpo de todas as abas a cada rerun; com o seletor,
+    # só a visão ativa monta DataFrames e serializa gráficos.
+    view = st.radio(
+        "Visualização",
+        VIEWS,
+        horizontal=True,
+        key="active_view",
+        label_visibility="collapsed",
+    )
+
+    # Preço & Book
+    if view == VIEW_PRICE:
+        st.subheader("Preço (last, bid, ask) ao longo dos ticks")
+        if st.session_state.price_history:
+            price_df = chart_frame("price_history")
+
+            cols_price = [c for c in ["last", "bid", "ask"] if c in price_df.columns]
+            if cols_price:
+                st.line_chart(price_df[cols_price])
+            else:
+                st.info("Sem dados de preço suficientes.")
+
+            st.subheader("Imbalance do book")
+            if "bid_size" in price_df.columns and "ask_size" in price_df.columns:
+                bid_sizes = price_df["bid_size"].to_numpy()
+                ask_sizes = price_df["ask_size"].to_numpy()
+                total = bid_sizes + ask_sizes
+                nonzero = total > 0
+                # imbalance = (bid - ask) / total, 0 onde o book está vazio
+                imbalance = np.where(
+                    nonzero,
+                    (bid_sizes - ask_sizes) / np.where(nonzero, total, 1.0),
+                    0.0,
+                )
+                st.line_chart(
+                    pd.Series(imbalance, index=price_df.index, name="imbalance")
+                )
+            else:
+                st.info("Sem dados de tamanho de book para calcular imbalance.")
+        else:
+            st.info("Ainda não há dados de preço. Clique em 'Rodar' na barra lateral.")
+
+    # PnL / Equity
+    elif view == VIEW_PNL:
+        st.subheader("PnL realizado e Equity (fictícia: 1000 + PnL)")
+        if st.session_state.pnl_history:
+            pnl_df = chart_frame("pnl_history")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.write("PnL realizado")
+                st.line_chart(pnl_df["realized_pnl"])
+            with col2:
+                st.write("Equity (simulada)")
+                equity = pnl_df["realized_pnl"] + st.session_state.initial_equity
+                st.line_chart(equity.rename("equity"))
+        else:
+            st.info("Ainda não há PnL. Rode alguns ticks para ver os resultados.")
+
+    # Trades
+    elif view == VIEW_TRADES:
+        st.subheader("Trades executados (simulados)")
+        if st.session_state.trades:
+            st.dataframe(trades_frame())
+        else:
+            st.info("Nenhum trade executado ainda.")
+
+    # Sinais
+    elif view == VIEW_SIGNALS:
+        st.subheader("Últimos sinais da estratégia (snapshot)")
+        last_signals = st.session_state.engine.snapshot()["last_signals"]
+        if last_signals:
+            sig_df = pd.DataFrame(last_signals)
+            st.dataframe(sig_df)
+        else:
+            st.info("Nenhum sinal gerado ainda ou ainda não processado.")
+
+    # Eventos
+    elif view == VIEW_EVENTS:
+        st.subheader("Log de eventos (trades, rejeições, erros, circuit breaker)")
+        if st.session_state.event_log:
+            st.dataframe(events_frame())
+        else:
+            st.info("Nenhum evento registrado ainda.")
+
+
+
 def main():
     st.set_page_config(page_title="Robô HFT - Lab Streamlit", layout="wide")
 
     # ------------------------------------------------------------------
     # 0) Seleção de ambiente na sidebar
     # ------------------------------------------------------------------
-    env_label_to_name = {
-        "LAB / Dummy": "lab_dummy",
-        "Binance Testnet": "binance_testnet",
-        "Binance LIVE": "binance_live",
-    }
-
     if "env_label" not in st.session_state:
         st.session_state.env_label = "LAB / Dummy"
 
     st.sidebar.header("Ambiente")
     selected_label = st.sidebar.radio(
         "Selecione o ambiente",
-        list(env_label_to_name.keys()),
-        index=list(env_label_to_name.keys()).index(st.session_state.env_label),
+        ENV_LABELS,
+        index=ENV_LABEL_INDEX[st.session_state.env_label],
     )
     st.session_state.env_label = selected_label
-    env_name = env_label_to_name[selected_label]
+    env_name = ENV_LABEL_TO_NAME[selected_label]
 
     # Se o ambiente mudar, limpamos engine/históricos para evitar mistura
     prev_env = st.session_state.get("env_name")
     if prev_env is not None and prev_env != env_name:
+        close_data_iter()
         for key in [
             "engine",
             "data_iter",
@@ -257,6 +713,15 @@ def main():
             "trades",
             "event_log",
             "exchange_effective_cfg",
+            "trades_df",
+            "trades_df_len",
+            "events_df",
+            "events_df_version",
+            "chart_frames",
+            "metrics",
+            "metrics_version",
+            "pnl_peak",
+            "pnl_max_drawdown",
         ]:
             st.session_state.pop(key, None)
     st.session_state.env_name = env_name
@@ -264,7 +729,7 @@ def main():
     # ------------------------------------------------------------------
     # 1) Carrega settings do ambiente selecionado
     # ------------------------------------------------------------------
-    settings = load_settings(env_name_override=env_name)
+    settings = load_settings_cached(env_name)
 
     base_exchange_cfg = settings["exchange"]
     yaml_strat_cfg = settings["strategy"]
@@ -321,225 +786,44 @@ def main():
     # ------------------------------------------------------------------
     st.sidebar.header("Configuração da Estratégia")
 
-    strategy_options = [
-        "simple_maker_taker",
-        "market_maker_v1",
-        "market_maker_v2",
-        "micro_momentum_v1",
-        "imbalance_v1",
-        "mean_reversion_v1",
-    ]
-
     strategy_name = st.sidebar.selectbox(
         "Estratégia",
-        options=strategy_options,
-        index=strategy_options.index(current_strategy_name)
-        if current_strategy_name in strategy_options
-        else 0,
+        options=STRATEGY_OPTIONS,
+        index=STRATEGY_INDEX.get(current_strategy_name, 0),
     )
 
-    def param_value(key: str, default: float | int | str) -> Any:
-        if key in current_params:
-            return current_params[key]
-        if key in yaml_strat_params:
-            return yaml_strat_params[key]
-        return default
-
+    # Valor efetivo de cada parâmetro: sessão > YAML > default do schema
+    effective: Dict[str, Any] = {**yaml_strat_params, **current_params}
     new_params: Dict[str, Any] = dict(current_params)
 
     # ---- Parâmetros por estratégia (UI) ---- #
-    if strategy_name == "simple_maker_taker":
-        st.sidebar.markdown("**Simple Maker/Taker**")
-        new_params["min_spread"] = st.sidebar.number_input(
-            "min_spread", value=float(param_value("min_spread", 1.0)), step=0.1
-        )
-        new_params["order_size"] = st.sidebar.number_input(
-            "order_size",
-            value=float(param_value("order_size", 0.001)),
-            step=0.0001,
-            format="%.6f",
-        )
-        new_params["tick_interval"] = st.sidebar.number_input(
-            "tick_interval",
-            value=int(param_value("tick_interval", 5)),
-            step=1,
-            min_value=1,
-        )
-
-    elif strategy_name == "market_maker_v1":
-        st.sidebar.markdown("**Market Maker V1**")
-        new_params["min_spread"] = st.sidebar.number_input(
-            "min_spread", value=float(param_value("min_spread", 1.0)), step=0.1
-        )
-        new_params["max_spread"] = st.sidebar.number_input(
-            "max_spread", value=float(param_value("max_spread", 10.0)), step=0.1
-        )
-        new_params["spread_pct"] = st.sidebar.number_input(
-            "spread_pct",
-            value=float(param_value("spread_pct", 0.0)),
-            step=0.0001,
-            format="%.4f",
-        )
-        new_params["quote_size"] = st.sidebar.number_input(
-            "quote_size",
-            value=float(param_value("quote_size", 0.001)),
-            step=0.0001,
-            format="%.6f",
-        )
-        new_params["tick_interval"] = st.sidebar.number_input(
-            "tick_interval",
-            value=int(param_value("tick_interval", 5)),
-            step=1,
-            min_value=1,
-        )
-
-    elif strategy_name == "market_maker_v2":
-        st.sidebar.markdown("**Market Maker V2 (adaptativo)**")
-        new_params["min_spread"] = st.sidebar.number_input(
-            "min_spread", value=float(param_value("min_spread", 1.0)), step=0.1
-        )
-        new_params["max_spread"] = st.sidebar.number_input(
-            "max_spread", value=float(param_value("max_spread", 15.0)), step=0.1
-        )
-        new_params["spread_pct"] = st.sidebar.number_input(
-            "spread_pct",
-            value=float(param_value("spread_pct", 0.0)),
-            step=0.0001,
-            format="%.4f",
-        )
-        new_params["quote_size"] = st.sidebar.number_input(
-            "quote_size",
-            value=float(param_value("quote_size", 0.001)),
-            step=0.0001,
-            format="%.6f",
-        )
-        new_params["tick_interval"] = st.sidebar.number_input(
-            "tick_interval",
-            value=int(param_value("tick_interval", 5)),
-            step=1,
-            min_value=1,
-        )
-        new_params["vol_window"] = st.sidebar.number_input(
-            "vol_window",
-            value=int(param_value("vol_window", 50)),
-            step=1,
-            min_value=5,
-        )
-        new_params["vol_factor"] = st.sidebar.number_input(
-            "vol_factor",
-            value=float(param_value("vol_factor", 1.0)),
-            step=0.1,
-        )
-
-    elif strategy_name == "micro_momentum_v1":
-        st.sidebar.markdown("**Micro Momentum V1**")
-        new_params["lookback_ticks"] = st.sidebar.number_input(
-            "lookback_ticks",
-            value=int(param_value("lookback_ticks", 10)),
-            step=1,
-            min_value=3,
-        )
-        new_params["min_moves"] = st.sidebar.number_input(
-            "min_moves",
-            value=int(param_value("min_moves", 3)),
-            step=1,
-            min_value=1,
-        )
-        new_params["min_return"] = st.sidebar.number_input(
-            "min_return",
-            value=float(param_value("min_return", 0.0005)),
-            step=0.0001,
-            format="%.4f",
-        )
-        new_params["order_size"] = st.sidebar.number_input(
-            "order_size",
-            value=float(param_value("order_size", 0.001)),
-            step=0.0001,
-            format="%.6f",
-        )
-        new_params["cooldown_ticks"] = st.sidebar.number_input(
-            "cooldown_ticks",
-            value=int(param_value("cooldown_ticks", 10)),
-            step=1,
-            min_value=0,
-        )
-        new_params["side_bias"] = st.sidebar.selectbox(
-            "side_bias",
-            options=["both", "long_only", "short_only"],
-            index=["both", "long_only", "short_only"].index(
-                param_value("side_bias", "both")
-            ),
-        )
-
-    elif strategy_name == "imbalance_v1":
-        st.sidebar.markdown("**Imbalance V1**")
-        new_params["imbalance_threshold"] = st.sidebar.number_input(
-            "imbalance_threshold",
-            value=float(param_value("imbalance_threshold", 0.6)),
-            step=0.05,
-        )
-        new_params["min_total_size"] = st.sidebar.number_input(
-            "min_total_size",
-            value=float(param_value("min_total_size", 1.0)),
-            step=0.1,
-        )
-        new_params["imbalance_order_size"] = st.sidebar.number_input(
-            "imbalance_order_size",
-            value=float(param_value("imbalance_order_size", 0.001)),
-            step=0.0001,
-            format="%.6f",
-        )
-        new_params["imbalance_cooldown_ticks"] = st.sidebar.number_input(
-            "imbalance_cooldown_ticks",
-            value=int(param_value("imbalance_cooldown_ticks", 5)),
-            step=1,
-            min_value=0,
-        )
-        new_params["imbalance_side_bias"] = st.sidebar.selectbox(
-            "imbalance_side_bias",
-            options=["both", "long_only", "short_only"],
-            index=["both", "long_only", "short_only"].index(
-                param_value("imbalance_side_bias", "both")
-            ),
+    # Dentro de um form: editar os campos não dispara rerun; os valores
+    # (e a strategy_cfg) só mudam ao clicar em "Aplicar".
+    title, specs = STRATEGY_PARAM_SCHEMA[strategy_name]
+    strategy_form = st.sidebar.form("strategy_form")
+    strategy_form.markdown(f"**{title}**")
+
+    for spec in specs:
+        value = effective.get(spec.key, spec.default)
+
+        if spec.cast is str:
+            # parâmetros textuais do schema são todos side_bias
+            new_params[spec.key] = strategy_form.selectbox(
+                spec.key,
+                options=SIDE_BIAS_OPTIONS,
+                index=SIDE_BIAS_INDEX[value],
+            )
+            continue
+
+        new_params[spec.key] = strategy_form.number_input(
+            spec.key,
+            value=spec.cast(value),
+            step=spec.step,
+            format=spec.fmt,
+            min_value=spec.min_value,
         )
 
-    elif strategy_name == "mean_reversion_v1":
-        st.sidebar.markdown("**Mean Reversion V1**")
-        new_params["mr_lookback_ticks"] = st.sidebar.number_input(
-            "mr_lookback_ticks",
-            value=int(param_value("mr_lookback_ticks", 20)),
-            step=1,
-            min_value=5,
-        )
-        new_params["mr_z_threshold"] = st.sidebar.number_input(
-            "mr_z_threshold",
-            value=float(param_value("mr_z_threshold", 2.0)),
-            step=0.1,
-        )
-        new_params["mr_order_size"] = st.sidebar.number_input(
-            "mr_order_size",
-            value=float(param_value("mr_order_size", 0.001)),
-            step=0.0001,
-            format="%.6f",
-        )
-        new_params["mr_cooldown_ticks"] = st.sidebar.number_input(
-            "mr_cooldown_ticks",
-            value=int(param_value("mr_cooldown_ticks", 10)),
-            step=1,
-            min_value=0,
-        )
-        new_params["mr_side_bias"] = st.sidebar.selectbox(
-            "mr_side_bias",
-            options=["both", "long_only", "short_only"],
-            index=["both", "long_only", "short_only"].index(
-                param_value("mr_side_bias", "both")
-            ),
-        )
-        new_params["mr_max_z_cap"] = st.sidebar.number_input(
-            "mr_max_z_cap",
-            value=float(param_value("mr_max_z_cap", 5.0)),
-            step=0.5,
-        )
+    strategy_form.form_submit_button("Aplicar", use_container_width=True)
 
     # Atualiza a strategy_cfg na sessão
     st.session_state.strategy_cfg = {"name": strategy_name, "params": new_params}
@@ -561,16 +845,21 @@ def main():
         datafeed_default = base_exchange_cfg.get("datafeed", "dummy_orderbook")
         datafeed_current = exchange_override.get("datafeed", datafeed_default)
 
+        datafeed_index = DUMMY_DATAFEED_INDEX.get(datafeed_current)
+        if datafeed_index is None:
+            datafeed_index = DUMMY_DATAFEED_INDEX[datafeed_default]
+
         datafeed_type = st.sidebar.selectbox(
             "Tipo de datafeed dummy",
-            options=["dummy", "dummy_orderbook"],
-            index=["dummy", "dummy_orderbook"].index(datafeed_current)
-            if datafeed_current in ["dummy", "dummy_orderbook"]
-            else ["dummy", "dummy_orderbook"].index(datafeed_default),
+            options=DUMMY_DATAFEED_OPTIONS,
+            index=datafeed_index,
         )
         exchange_override["datafeed"] = datafeed_type
 
-        start_price = st.sidebar.number_input(
+        # Campos numéricos num form, como os da estratégia
+        market_form = st.sidebar.form("market_form")
+
+        start_price = market_form.number_input(
             "Preço inicial (mid)",
             value=float(
                 exchange_override.get(
@@ -580,7 +869,7 @@ def main():
             step=100.0,
             format="%.2f",
         )
-        tick_sleep = st.sidebar.number_input(
+        tick_sleep = market_form.number_input(
             "tick_sleep (s)",
             value=float(
                 exchange_override.get(
@@ -596,7 +885,7 @@ def main():
         exchange_override["tick_sleep"] = tick_sleep
 
         if datafeed_type == "dummy_orderbook":
-            volatility = st.sidebar.number_input(
+            volatility = market_form.number_input(
                 "Volatilidade base (%)",
                 value=float(
                     100
@@ -607,7 +896,7 @@ def main():
                 step=0.01,
                 format="%.2f",
             )
-            base_spread_ticks = st.sidebar.number_input(
+            base_spread_ticks = market_form.number_input(
                 "Spread médio (ticks)",
                 value=float(
                     exchange_override.get(
@@ -618,7 +907,7 @@ def main():
                 step=0.1,
                 format="%.2f",
             )
-            depth_levels = st.sidebar.number_input(
+            depth_levels = market_form.number_input(
                 "Níveis do book por lado",
                 value=int(
                     exchange_override.get(
@@ -629,7 +918,7 @@ def main():
                 min_value=1,
                 max_value=50,
             )
-            base_liquidity = st.sidebar.number_input(
+            base_liquidity = market_form.number_input(
                 "Liquidez base por nível",
                 value=float(
                     exchange_override.get(
@@ -645,6 +934,8 @@ def main():
             exchange_override["depth_levels"] = depth_levels
             exchange_override["base_liquidity"] = base_liquidity
 
+        market_form.form_submit_button("Aplicar", use_container_width=True)
+
         st.session_state.exchange_override = exchange_override
 
     else:
@@ -663,156 +954,80 @@ def main():
             st.session_state.exchange_override if provider == "dummy" else None,
         )
 
-    engine: TradingEngine = st.session_state.engine
-    effective_exchange_cfg = st.session_state.get(
-        "exchange_effective_cfg", base_exchange_cfg
-    )
-
     # ------------------------------------------------------------------
     # 7) Controles de execução
     # ------------------------------------------------------------------
     st.sidebar.markdown("---")
     st.sidebar.header("Execução")
-
-    st.sidebar.write(f"**Símbolo:** `{effective_exchange_cfg['symbol']}`")
-    st.sidebar.write(f"**Provider (YAML):** `{base_exchange_cfg.get('provider', 'dummy')}`")
-    st.sidebar.write(
-        f"**Datafeed efetivo:** `{effective_exchange_cfg.get('datafeed', 'dummy')}`"
-    )
-    st.sidebar.write(
-        f"**Estratégia ativa:** `{st.session_state.strategy_cfg['name']}`"
-    )
+    # Preenchido depois dos botões, para já refletir um reset deste rerun
+    exec_info = st.sidebar.container()
 
     step_ticks = st.sidebar.number_input(
         "Nº de ticks por passo", min_value=1, max_value=5000, value=100, step=50
     )
+    auto_run = st.sidebar.toggle(
+        "Rodar automaticamente",
+        key="auto_run",
+        help=(
+            f"Processa um passo a cada {AUTO_RUN_INTERVAL:g}s e atualiza só "
+            "métricas e gráficos (o estado na sidebar só muda no próximo rerun)."
+        ),
+    )
 
     col_b1, col_b2 = st.sidebar.columns(2)
     if col_b1.button("▶ Rodar", use_container_width=True):
         process_n_ticks(int(step_ticks))
 
     if col_b2.button("🔁 Resetar (aplicar estratégia/mercado)", use_container_width=True):
+        # Sem st.rerun(): o restante deste rerun já lê o engine novo
         init_engine_and_data(
             st.session_state.strategy_cfg,
             env_name,
             st.session_state.exchange_override if provider == "dummy" else None,
         )
-        st.rerun()
+
+    engine: TradingEngine = st.session_state.engine
+    effective_exchange_cfg = st.session_state.get(
+        "exchange_effective_cfg", base_exchange_cfg
+    )
+
+    # Um único bloco markdown (uma mensagem ao front-end) por seção
+    exec_info.markdown(
+        f"**Símbolo:** `{effective_exchange_cfg['symbol']}`\n\n"
+        f"**Provider (YAML):** `{base_exchange_cfg.get('provider', 'dummy')}`\n\n"
+        f"**Datafeed efetivo:** `{effective_exchange_cfg.get('datafeed', 'dummy')}`\n\n"
+        f"**Estratégia ativa:** `{st.session_state.strategy_cfg['name']}`"
+    )
 
     st.sidebar.info(
-        "Ao alterar estratégia ou parâmetros de mercado (dummy), clique em **Resetar** "
-        "para recriar o engine com essa configuração."
+        "Ao alterar estratégia ou parâmetros de mercado (dummy), clique em **Aplicar** "
+        "e depois em **Resetar** para recriar o engine com essa configuração."
     )
 
     snap = engine.snapshot()
     st.sidebar.markdown("---")
     st.sidebar.subheader("Estado do Engine")
-    st.sidebar.write(f"Running: `{snap['running']}`")
-    st.sidebar.write(f"Ticks processados: `{snap['tick_count']}`")
-    st.sidebar.write(f"Trades executados: `{snap['trade_count']}`")
-    st.sidebar.write(f"Último preço: `{snap['last_price']}`")
-    st.sidebar.write(
-        f"Posição: `{snap['position']['qty']}` @ `{snap['position']['avg_price']}`"
+    position = snap["position"]
+    st.sidebar.markdown(
+        f"Running: `{snap['running']}`\n\n"
+        f"Ticks processados: `{snap['tick_count']}`\n\n"
+        f"Trades executados: `{snap['trade_count']}`\n\n"
+        f"Último preço: `{snap['last_price']}`\n\n"
+        f"Posição: `{position['qty']}` @ `{position['avg_price']}`\n\n"
+        f"PnL realizado: `{position['realized_pnl']}`"
     )
-    st.sidebar.write(f"PnL realizado: `{snap['position']['realized_pnl']}`")
     if snap["last_error"]:
         st.sidebar.error(f"Erro recente: {snap['last_error']}")
 
     # ------------------------------------------------------------------
-    # 8) Métricas gerais (header)
-    # ------------------------------------------------------------------
-    metrics = compute_metrics()
-    st.subheader("📊 Métricas gerais do robô (sessão atual)")
-
-    mc1, mc2, mc3, mc4 = st.columns(4)
-    mc1.metric("PnL líquido", f"{metrics['net_pnl']:.4f}")
-    mc2.metric("Win rate", f"{metrics['win_rate']:.2f}%")
-    mc3.metric("Max Drawdown", f"{metrics['max_drawdown']:.4f}")
-    mc4.metric("Trades", metrics["total_trades"])
-
-    st.markdown("---")
-
-    # ------------------------------------------------------------------
-    # 9) Abas principais
+    # 8) Métricas e visões principais (fragmento; reexecuta sozinho no
+    #    modo automático)
     # ------------------------------------------------------------------
-    tab_price, tab_pnl, tab_trades, tab_signals, tab_events = st.tabs(
-        ["📈 Preço & Book", "💰 PnL / Equity", "📜 Trades", "📡 Sinais", "📝 Eventos"]
+    dashboard = st.fragment(
+        render_dashboard, run_every=AUTO_RUN_INTERVAL if auto_run else None
     )
-
-    # Preço & Book
-    with tab_price:
-        st.subheader("Preço (last, bid, ask) ao longo dos ticks")
-        if st.session_state.price_history:
-            price_df = pd.DataFrame(st.session_state.price_history)
-            price_df = price_df.sort_values("ts").set_index("ts")
-
-            cols_price = [c for c in ["last", "bid", "ask"] if c in price_df.columns]
-            if cols_price:
-                st.line_chart(price_df[cols_price])
-            else:
-                st.info("Sem dados de preço suficientes.")
-
-            st.subheader("Imbalance do book")
-            if "bid_size" in price_df.columns and "ask_size" in price_df.columns:
-                df_imb = price_df[["bid_size", "ask_size"]].copy()
-                total = df_imb["bid_size"] + df_imb["ask_size"]
-                df_imb["imbalance"] = 0.0
-                nonzero = total > 0
-                df_imb.loc[nonzero, "imbalance"] = (
-                    (df_imb.loc[nonzero, "bid_size"] - df_imb.loc[nonzero, "ask_size"])
-                    / total.loc[nonzero]
-                )
-                st.line_chart(df_imb["imbalance"])
-            else:
-                st.info("Sem dados de tamanho de book para calcular imbalance.")
-        else:
-            st.info("Ainda não há dados de preço. Clique em 'Rodar' na barra lateral.")
-
-    # PnL / Equity
-    with tab_pnl:
-        st.subheader("PnL realizado e Equity (fictícia: 1000 + PnL)")
-        if st.session_state.pnl_history:
-            pnl_df = pd.DataFrame(st.session_state.pnl_history)
-            pnl_df = pnl_df.sort_values("ts").set_index("ts")
-
-            col1, col2 = st.columns(2)
-            with col1:
-                st.write("PnL realizado")
-                st.line_chart(pnl_df["realized_pnl"])
-            with col2:
-                st.write("Equity (simulada)")
-                st.line_chart(pnl_df["equity"])
-        else:
-            st.info("Ainda não há PnL. Rode alguns ticks para ver os resultados.")
-
-    # Trades
-    with tab_trades:
-        st.subheader("Trades executados (simulados)")
-        if st.session_state.trades:
-            trades_df = pd.DataFrame(st.session_state.trades)
-            st.dataframe(trades_df)
-        else:
-            st.info("Nenhum trade executado ainda.")
-
-    # Sinais
-    with tab_signals:
-        st.subheader("Últimos sinais da estratégia (snapshot)")
-        last_signals = snap["last_signals"]
-        if last_signals:
-            sig_df = pd.DataFrame(last_signals)
-            st.dataframe(sig_df)
-        else:
-            st.info("Nenhum sinal gerado ainda ou ainda não processado.")
-
-    # Eventos
-    with tab_events:
-        st.subheader("Log de eventos (trades, rejeições, erros, circuit breaker)")
-        if st.session_state.event_log:
-            events_df = pd.DataFrame(st.session_state.event_log)
-            events_df = events_df.sort_values("ts", ascending=False)
-            st.dataframe(events_df)
-        else:
-            st.info("Nenhum evento registrado ainda.")
+    st.session_state.dashboard_full_run = True
+    dashboard(int(step_ticks) if auto_run else 0)
 
 
 if __name__ == "__main__":
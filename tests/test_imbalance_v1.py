@@ -0,0 +1,61 @@
+# tests/test_imbalance_v1.py
+
+from strategies.imbalance_v1 import ImbalanceV1, ImbalanceV1Config
+
+
+def make_tick(bid_size: float, ask_size: float) -> dict:
+    return {
+        "symbol": "BTCUSDT",
+        "bid": 100.0,
+        "ask": 101.0,
+        "last": 100.5,
+        "bid_size": bid_size,
+        "ask_size": ask_size,
+        "ts": 0.0,
+    }
+
+
+def test_imbalance_buy_and_sell_signals():
+    cfg = ImbalanceV1Config(
+        imbalance_threshold=0.6,
+        min_total_size=1.0,
+        order_size=0.001,
+        cooldown_ticks=0,
+        side_bias="both",
+    )
+    strat = ImbalanceV1(symbol="BTCUSDT", config=cfg)
+
+    # imbalance = (9 - 1) / 10 = 0.8 -> BUY
+    signals = strat.on_tick(make_tick(9.0, 1.0))
+    assert len(signals) == 1
+    assert signals[0].side == "BUY"
+
+    # imbalance = (1 - 9) / 10 = -0.8 -> SELL
+    signals = strat.on_tick(make_tick(1.0, 9.0))
+    assert len(signals) == 1
+    assert signals[0].side == "SELL"
+
+
+def test_imbalance_below_threshold_rejected():
+    cfg = ImbalanceV1Config(imbalance_threshold=0.6, cooldown_ticks=0)
+    strat = ImbalanceV1(symbol="BTCUSDT", config=cfg)
+
+    # imbalance = (7 - 3) / 10 = 0.4 -> abaixo do threshold
+    assert strat.on_tick(make_tick(7.0, 3.0)) == []
+    # imbalance = -0.4
+    assert strat.on_tick(make_tick(3.0, 7.0)) == []
+
+
+def test_imbalance_exactly_on_threshold_triggers():
+    cfg = ImbalanceV1Config(imbalance_threshold=0.1, min_total_size=1.0, cooldown_ticks=0)
+    strat = ImbalanceV1(symbol="BTCUSDT", config=cfg)
+
+    # imbalance = (9 - 11) / 20 = -0.1 -> |imbalance| não está abaixo do threshold
+    signals = strat.on_tick(make_tick(9.0, 11.0))
+    assert len(signals) == 1
+    assert signals[0].side == "SELL"
+
+    # imbalance = (11 - 9) / 20 = 0.1
+    signals = strat.on_tick(make_tick(11.0, 9.0))
+    assert len(signals) == 1
+    assert signals[0].side == "BUY"
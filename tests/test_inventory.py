@@ -1,5 +1,7 @@
 # tests/test_inventory.py
 
+import random
+
 import pytest
 
 from core.inventory import InventoryLimits, InventoryRiskManager, InventoryLimitExceeded
@@ -72,3 +74,46 @@ def test_inventory_within_limits_passes():
         price=price,
         account_equity=equity,
     )
+
+
+def test_validate_batch_matches_validate_inventory():
+    inv = make_default_inventory_manager()
+    rng = random.Random(3)
+
+    current_qtys, sides, trade_qtys, prices = [], [], [], []
+    for _ in range(200):
+        current_qtys.append(rng.uniform(-0.02, 0.02))
+        sides.append(rng.choice([1, -1]))
+        trade_qtys.append(rng.choice([0.001, 0.005, 0.01]))
+        prices.append(rng.uniform(10000.0, 100000.0))
+
+    mask = inv.validate_batch(current_qtys, sides, trade_qtys, prices, 1000.0)
+
+    for i in range(len(mask)):
+        try:
+            inv.validate_inventory(
+                current_qty=current_qtys[i],
+                trade_side="BUY" if sides[i] == 1 else "SELL",
+                trade_qty=trade_qtys[i],
+                price=prices[i],
+                account_equity=1000.0,
+            )
+            expected = True
+        except InventoryLimitExceeded:
+            expected = False
+        assert bool(mask[i]) == expected
+
+
+def test_validate_batch_rejects_invalid_inputs():
+    inv = make_default_inventory_manager()
+
+    with pytest.raises(ValueError):
+        inv.validate_batch([0.0], [1], [0.0], [100.0], 1000.0)
+    with pytest.raises(ValueError):
+        inv.validate_batch([0.0], [0], [0.001], [100.0], 1000.0)
+    with pytest.raises(ValueError):
+        inv.validate_batch([0.0], [1.7], [0.001], [100.0], 1000.0)
+    with pytest.raises(ValueError):
+        inv.validate_batch([0.0, 0.0], [1, -1.2], [0.001, 0.001], [100.0, 100.0], 1000.0)
+    with pytest.raises(ValueError):
+        inv.validate_batch([0.0], [1], [0.001], [100.0], 0.0)
@@ -25,3 +25,21 @@ def test_market_maker_generates_two_quotes():
     assert len(signals) == 2
     sides = {s.side for s in signals}
     assert sides == {"BUY", "SELL"}
+
+
+def test_market_maker_updates_quote_prices_each_tick():
+    cfg = MarketMakerV1Config(
+        min_spread=2.0,
+        max_spread=5.0,
+        spread_pct=0.0,
+        quote_size=0.001,
+        tick_interval=1,
+    )
+    strat = MarketMakerV1(symbol="BTCUSDT", config=cfg)
+
+    first = strat.on_tick({"bid": 100.0, "ask": 102.0, "last": 101.0, "ts": 0.0})
+    assert [s.price for s in first] == [100.0, 102.0]
+
+    second = strat.on_tick({"bid": 110.0, "ask": 112.0, "last": 111.0, "ts": 1.0})
+    assert [s.price for s in second] == [110.0, 112.0]
+    assert [s.size for s in second] == [0.001, 0.001]
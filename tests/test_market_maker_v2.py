@@ -1,5 +1,10 @@
 # tests/test_market_maker_v2.py
 
+import random
+import statistics
+
+import pytest
+
 from strategies.market_maker_v2 import MarketMakerV2, MarketMakerV2Config
 
 
@@ -36,3 +41,32 @@ def test_market_maker_v2_generates_two_quotes():
     assert len(signals) == 2
     sides = {s.side for s in signals}
     assert sides == {"BUY", "SELL"}
+
+
+def test_market_maker_v2_spread_tracks_rolling_volatility():
+    cfg = MarketMakerV2Config(
+        min_spread=0.0,
+        max_spread=1000.0,
+        spread_pct=0.0,
+        quote_size=0.001,
+        tick_interval=1,
+        vol_window=7,
+        vol_factor=2.0,
+    )
+    strat = MarketMakerV2(symbol="BTCUSDT", config=cfg)
+    rng = random.Random(11)
+
+    mids = []
+    mid = 100.0
+    for _ in range(300):
+        mid += rng.gauss(0.0, 0.3)
+        mids.append(mid)
+        signals = strat.on_tick({"bid": mid - 0.5, "ask": mid + 0.5, "last": mid})
+
+        window = mids[-cfg.vol_window :]
+        vol = statistics.stdev(window) if len(window) > 1 else 0.0
+        spread = signals[1].price - signals[0].price
+
+        # Welford deslizante: igual ao cálculo em duas passadas só até
+        # a tolerância de ponto flutuante
+        assert spread == pytest.approx(cfg.vol_factor * vol, rel=1e-9, abs=1e-9)
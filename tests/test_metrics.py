@@ -0,0 +1,17 @@
+# tests/test_metrics.py
+
+from core.metrics import max_drawdown
+
+
+def test_max_drawdown_empty_curve():
+    assert max_drawdown([]) == 0.0
+
+
+def test_max_drawdown_monotonic_up_is_zero():
+    assert max_drawdown([100.0, 101.0, 105.0, 110.0]) == 0.0
+
+
+def test_max_drawdown_uses_previous_peak():
+    # pico 120 -> vale 90 = 30; depois pico 130 -> 110 = 20
+    curve = [100.0, 120.0, 90.0, 130.0, 110.0]
+    assert max_drawdown(curve) == 30.0
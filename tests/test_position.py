@@ -1,5 +1,9 @@
 # tests/test_position.py
 
+import random
+
+import pytest
+
 from core.position import PositionManager
 
 
@@ -82,3 +86,52 @@ def test_unrealized_pnl_long_and_short():
     # Preço atual 110 => PnL não realizado = (110 - 120)*1*(-1) = 10
     assert pos.qty == -1.0
     assert pos.unrealized_pnl(110.0) == 10.0
+
+
+def test_replay_matches_on_trade_sequence():
+    rng = random.Random(7)
+    fills = [
+        (rng.choice((1, -1)), rng.choice((0.5, 1.0, 1.5, 2.0)), rng.uniform(90.0, 110.0))
+        for _ in range(200)
+    ]
+
+    ref = PositionManager()
+    expected = []
+    for direction, qty, price in fills:
+        ref.on_trade("BUY" if direction > 0 else "SELL", qty, price)
+        expected.append(ref.realized_pnl)
+
+    pos = PositionManager()
+    realized = pos.replay(*zip(*fills))
+
+    assert realized.tolist() == expected
+    assert pos.qty == ref.qty
+    assert pos.avg_price == ref.avg_price
+    assert pos.realized_pnl == ref.realized_pnl
+
+
+def test_replay_continues_from_current_position():
+    pos = PositionManager()
+    pos.on_trade("BUY", 1.0, 100.0)   # long 1 @ 100
+
+    # vende 2 @ 90 (fecha com -10 e fica short 1 @ 90), recompra 1 @ 80
+    realized = pos.replay([-1, 1], [2.0, 1.0], [90.0, 80.0])
+
+    assert realized.tolist() == [-10.0, 0.0]
+    assert pos.qty == 0.0
+    assert pos.avg_price == 0.0
+    assert pos.realized_pnl == 0.0
+
+
+def test_replay_rejects_non_positive_qty():
+    pos = PositionManager()
+    with pytest.raises(ValueError):
+        pos.replay([1], [0.0], [100.0])
+
+
+def test_replay_rejects_non_unit_sides():
+    pos = PositionManager()
+    with pytest.raises(ValueError):
+        pos.replay([1.7], [1.0], [100.0])
+    with pytest.raises(ValueError):
+        pos.replay([1, -1.2], [1.0, 1.0], [100.0, 101.0])
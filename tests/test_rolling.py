@@ -0,0 +1,74 @@
+# tests/test_rolling.py
+
+import random
+from fractions import Fraction
+
+import pytest
+
+from core.rolling import RollingStats
+
+
+def _two_pass(values):
+    n = len(values)
+    mean = sum(values) / n
+    var = sum((v - mean) ** 2 for v in values) / (n - 1) if n > 1 else 0.0
+    return mean, var
+
+
+def test_rolling_matches_two_pass_stats():
+    rng = random.Random(7)
+    window = 20
+    stats = RollingStats(window)
+    values = []
+
+    for _ in range(500):
+        x = 100.0 + rng.gauss(0.0, 0.5)
+        stats.push(x)
+        values.append(x)
+
+        expected_mean, expected_var = _two_pass(values[-window:])
+        assert len(stats) == min(len(values), window)
+        assert stats.mean == pytest.approx(expected_mean, rel=1e-12)
+        assert stats.variance() == pytest.approx(expected_var, rel=1e-6, abs=1e-12)
+
+
+def test_rolling_is_precise_at_btc_price_levels():
+    # preços ~1e5 num grid de 0.01 com passos mínimos: desvio padrão de
+    # centavos sobre um nível enorme, o pior caso para somas acumuladas
+    rng = random.Random(5)
+    window = 20
+    stats = RollingStats(window)
+    price = 98765.43
+    values = []
+
+    for i in range(2000):
+        price = round(price + rng.choice((-0.01, 0.0, 0.01)), 2)
+        stats.push(price)
+        values.append(price)
+        if i < window:
+            continue
+
+        exact = [Fraction(v) for v in values[-window:]]
+        mean = sum(exact) / window
+        var = sum((v - mean) ** 2 for v in exact) / (window - 1)
+        if var == 0:
+            continue
+
+        z = stats.deviation(price) / stats.std()
+        expected_z = float((Fraction(price) - mean) / Fraction(float(var) ** 0.5))
+        assert z == pytest.approx(expected_z, abs=1e-12)
+
+
+def test_rolling_constant_window_has_zero_variance():
+    stats = RollingStats(5)
+    for x in [101.3, 99.7, 100.1, 100.1, 100.1, 100.1, 100.1]:
+        stats.push(x)
+
+    assert stats.full
+    assert stats.variance() == 0.0
+    assert stats.std() == 0.0
+
+
+def test_rolling_rejects_empty_window():
+    with pytest.raises(ValueError):
+        RollingStats(0)
@@ -0,0 +1,64 @@
+# tests/test_series_buffer.py
+
+import numpy as np
+
+from core.series_buffer import SeriesBuffer
+
+
+FIELDS = ("ts", "value")
+
+
+def test_series_buffer_grows_until_capacity():
+    buf = SeriesBuffer(FIELDS, capacity=8, initial_capacity=2)
+
+    for i in range(6):
+        buf.append(float(i), 10.0 * i)
+
+    assert len(buf) == 6
+    assert buf.total == 6
+    assert buf.column("ts").tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    assert buf.last("value") == 50.0
+
+
+def test_series_buffer_append_overflow_keeps_newest_rows():
+    buf = SeriesBuffer(FIELDS, capacity=4, initial_capacity=2)
+
+    for i in range(1, 6):
+        buf.append(float(i), float(i))
+
+    # ao encher, descarta a metade mais antiga (1 e 2) antes de gravar o 5
+    assert buf.column("ts").tolist() == [3.0, 4.0, 5.0]
+    assert buf.total == 5
+
+
+def test_series_buffer_extend_across_capacity():
+    buf = SeriesBuffer(FIELDS, capacity=8, initial_capacity=2)
+    buf.extend([(float(i), float(i)) for i in range(6)])
+    buf.extend([(float(i), float(i)) for i in range(6, 10)])
+
+    assert buf.column("ts").tolist() == [3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0]
+    assert buf.total == 10
+
+
+def test_series_buffer_extend_larger_than_capacity():
+    buf = SeriesBuffer(FIELDS, capacity=4, initial_capacity=2)
+    buf.append(-1.0, -1.0)
+    buf.extend([(float(i), 2.0 * i) for i in range(10)])
+
+    assert buf.column("ts").tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert buf.column("value").tolist() == [12.0, 14.0, 16.0, 18.0]
+    assert buf.total == 11
+
+
+def test_series_buffer_to_frame_tail_and_index():
+    buf = SeriesBuffer(FIELDS, capacity=8, initial_capacity=2)
+    buf.extend([(float(i), 10.0 * i) for i in range(3)])
+
+    # tail maior que o armazenado devolve todas as linhas
+    df = buf.to_frame(tail=100)
+    assert df["ts"].tolist() == [0.0, 1.0, 2.0]
+
+    df = buf.to_frame(tail=2, index="ts")
+    assert df.index.tolist() == [1.0, 2.0]
+    assert df.columns.tolist() == ["value"]
+    assert np.shares_memory(df["value"].to_numpy(), buf.column("value"))